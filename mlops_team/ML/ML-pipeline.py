@@ -1,7 +1,7 @@
 import os
 import mlflow
 import pyarrow.fs as pafs
-from clothing_rules import get_cloth_sense
+from clothing_rules import get_cloth_sense_batch
 from Preprocessing import Feature_Engineering
 from split_data import Data_Split
 from train import Tree_Models
@@ -76,7 +76,7 @@ def main(year=None):
     result_df = predict(model, fe_test.df[feature_cols], feature_cols)
     result_df = fe_test.df.copy()
     result_df['pred_temp'] = model.predict(fe_test.df[feature_cols])
-    result_df['cloth_rec'] = [get_cloth_sense(temp) for temp in result_df['pred_temp']]
+    result_df['cloth_rec'] = get_cloth_sense_batch(result_df['pred_temp'])
     result_df = result_df[['year', 'month', 'day', 'hour', 'pred_temp', 'cloth_rec']]
     now = datetime.now().strftime('%Y%m%d_%H%M%S')
     s3_path = f"{S3_BUCKET}/inference/test_inference_results_{now}.parquet"
@@ -0,0 +1,96 @@
+"""
+예보 로딩(S3 + Parquet 파싱)이 진행되는 동안에도 API가 다른 요청에 바로 응답하는지 확인하는 동시성 벤치마크
+
+느린 로컬 S3 대역을 붙인 상태에서 콜드 스타트 요청(/forecast/latest)을 하나 보내고,
+그 요청이 끝날 때까지 / 엔드포인트를 계속 호출해 응답 시간을 잽니다.
+이벤트 루프가 막히면 로딩이 끝날 때까지 / 응답도 같이 멈추므로 최대 지연이 예산을 넘게 됩니다.
+로딩이 끝난 뒤에는 Arrow/NDJSON 형식의 첫 요청(br/gzip 압축 허용)을 보내, 직렬화/압축이
+요청 처리(이벤트 루프) 안에서 일어나지 않고 미리 준비된 본문이 나가는지도 확인합니다.
+
+    cd mlops_team && python benchmarks/bench_event_loop.py --s3-latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import httpx
+
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+from common import s3_loader
+from src.main import app
+from fake_s3 import seeded_client
+from src.forecast_responses import ARROW_STREAM_MEDIA_TYPE, NDJSON_MEDIA_TYPE
+
+# 로딩 뒤 첫 요청의 응답 시간을 잴 대량 조회 형식
+BULK_MEDIA_TYPES = (ARROW_STREAM_MEDIA_TYPE, NDJSON_MEDIA_TYPE)
+
+
+async def run(s3_latency, probe_interval):
+    s3_loader.set_s3_client(seeded_client(latency=s3_latency))
+
+    # lifespan(백그라운드 갱신)을 띄우지 않으므로 첫 요청이 직접 예보를 불러오는 콜드 스타트 상황
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        load = asyncio.create_task(client.get("/forecast/latest"))
+        await asyncio.sleep(0)
+
+        probe_latencies = []
+        while not load.done():
+            probe_started = time.perf_counter()
+            response = await client.get("/")
+            response.raise_for_status()
+            probe_latencies.append(time.perf_counter() - probe_started)
+            await asyncio.sleep(probe_interval)
+
+        load_response = await load
+        load_seconds = time.perf_counter() - started
+
+        # 같은 버전의 다른 형식 첫 요청: 이벤트 루프 위에서 처리되므로 걸린 시간이 곧 루프를 막은 시간
+        bulk_latencies = {}
+        for media_type in BULK_MEDIA_TYPES:
+            bulk_started = time.perf_counter()
+            response = await client.get("/forecast/latest", headers={"Accept": media_type, "Accept-Encoding": "br, gzip"})
+            response.raise_for_status()
+            bulk_latencies[media_type] = time.perf_counter() - bulk_started
+
+    return load_response.status_code, load_seconds, probe_latencies, bulk_latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--s3-latency', type=float, default=0.5, help='S3 호출 한 번당 인위적인 지연(초)')
+    parser.add_argument('--probe-interval', type=float, default=0.01, help='/ 호출 간격(초)')
+    parser.add_argument('--budget-ms', type=float, default=100.0, help='로딩 중 / 응답 시간 허용 최대치(ms)')
+    parser.add_argument('--bulk-budget-ms', type=float, default=10.0,
+                        help='로딩 후 Arrow/NDJSON 첫 요청 응답 시간 허용 최대치(ms, 미리 준비된 본문을 보내는 시간)')
+    args = parser.parse_args()
+
+    status, load_seconds, probes, bulk = asyncio.run(run(args.s3_latency, args.probe_interval))
+    worst_ms = max(probes) * 1000 if probes else float('inf')
+    worst_bulk_ms = max(bulk.values()) * 1000
+
+    print(f"콜드 로딩: status={status}, {load_seconds * 1000:.0f} ms")
+    print(f"로딩 중 / 호출 {len(probes)}회: "
+          f"p50={statistics.median(probes) * 1000 if probes else float('nan'):.1f} ms, max={worst_ms:.1f} ms")
+
+    for media_type, seconds in bulk.items():
+        print(f"로딩 후 첫 {media_type} 요청: {seconds * 1000:.1f} ms")
+
+    # 로딩 중에 응답한 요청이 거의 없거나 지연이 예산을 넘으면 이벤트 루프가 막힌 것
+    if status != 200 or len(probes) < 2 or worst_ms > args.budget_ms:
+        print(f"FAIL: 로딩 중 응답성이 예산({args.budget_ms:.0f} ms)을 만족하지 못했습니다.")
+        sys.exit(1)
+    # 첫 요청이 본문을 직렬화/압축했다면 미리 준비(snapshot warmer)가 빠진 것
+    if worst_bulk_ms > args.bulk_budget_ms:
+        print(f"FAIL: Arrow/NDJSON 첫 요청이 예산({args.bulk_budget_ms:.0f} ms)을 넘었습니다.")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+원천 날씨 데이터 백필의 메모리 사용량과 처리 시간을 비교하는 벤치마크
+
+로컬 기상청 API 대역(FakeKMAServer)과 메모리 파일 시스템(fsspec memory, S3 대신)을 붙여서 같은 기간을
+1. 기존 방식: 모든 구간을 모은 뒤 pd.concat → 일별 groupby → 저장
+2. ingest_weather_stream: 구간을 받는 대로 완성된 날짜부터 저장 (+ 구간마다 체크포인트)
+으로 수집하고, 걸린 시간과 파이썬 힙 최대 사용량(tracemalloc)을 출력합니다.
+두 방식이 같은 파티션(날짜 수, 행 수)을 만드는지도 확인합니다.
+
+    cd mlops_team && python benchmarks/bench_ingest.py --years 3
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import fsspec
+import pandas as pd
+
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+from data.wearher.v1_0_0.fake_kma import FakeKMAServer
+
+
+def run_legacy(ingest, date_ranges, fs):
+    """ 기존 initialize_weather_database의 흐름 (전체 기간을 모은 뒤 저장) """
+    frames = [df for _, _, df in ingest.fetch_windows(date_ranges, ingest.fetch_weather_data)]
+    combined = ingest.add_time_columns(pd.concat(frames))
+    for (year, month, day), group_df in combined.groupby(['year', 'month', 'day']):
+        group_df.drop(columns=['year', 'month', 'day']).to_parquet(
+            ingest.partition_path(year, month, day), index=False, engine='pyarrow', filesystem=fs
+        )
+
+
+def run_stream(ingest, date_ranges, fs):
+    ingest.ingest_weather_stream(date_ranges, desc="스트리밍 수집", s3=fs)
+
+
+def written_partitions(fs):
+    paths = [path for path in fs.find("/") if path.endswith("data.parquet")]
+    rows = sum(len(pd.read_parquet(path, filesystem=fs)) for path in paths)
+    return len(paths), rows
+
+
+def measure(label, run, ingest, date_ranges):
+    fs = fsspec.filesystem("memory")
+    fs.store.clear()
+    fs.pseudo_dirs.clear()
+    fs.pseudo_dirs.append("")
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    run(ingest, date_ranges, fs)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    partitions, rows = written_partitions(fs)
+    print(f"{label:<10} {seconds:7.2f} s  최대 힙 {peak / 1e6:8.1f} MB  파티션 {partitions}개, {rows}행")
+    return partitions, rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, default=3, help='수집할 기간(년, 현재 시각 기준으로 거슬러 올라감)')
+    parser.add_argument('--latency', type=float, default=0.0, help='API 요청 하나당 인위적인 지연(초)')
+    args = parser.parse_args()
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=365 * args.years)
+
+    with FakeKMAServer(latency=args.latency) as server:
+        # 수집 모듈이 import 될 때 API 주소/버킷 이름을 읽으므로 대역 서버를 띄운 뒤 import
+        os.environ["KMA_API_URL"] = server.url
+        os.environ["S3_BUCKET_NAME"] = "bench"
+        from data.wearher.v1_0_0 import ingest_raw_wearher as ingest
+
+        date_ranges = ingest.generate_date_ranges(start_date, end_date)
+        print(f"{len(date_ranges)}개 구간 ({start_date:%Y-%m-%d} ~ {end_date:%Y-%m-%d})")
+        legacy = measure("기존 방식", run_legacy, ingest, date_ranges)
+        stream = measure("스트리밍", run_stream, ingest, date_ranges)
+
+    if legacy != stream:
+        print("FAIL: 두 방식이 만든 파티션이 다릅니다.")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
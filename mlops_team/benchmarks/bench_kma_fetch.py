@@ -0,0 +1,97 @@
+"""
+기상청 API 백필 수집 속도를 비교하는 벤치마크
+
+로컬 기상청 API 대역(FakeKMAServer)을 띄우고, 같은 날짜 구간들을
+1. 한 구간씩 차례로 fetch_weather_data를 호출하는 방식(기존 방식)과
+2. fetch_windows(동시 요청 + 호출 한도 + 재시도)로
+받아와 걸린 시간, 구간/초, 서버가 받은 요청 수/새로 맺은 연결 수를 출력합니다. 두 방식의 결과(행 수, 순서)가 같은지도 확인합니다.
+마지막에 KMAClient가 기록한 호출별 응답 시간과 전송량(gzip 압축 전/후)을 출력합니다.
+
+    cd mlops_team && python benchmarks/bench_kma_fetch.py --years 5 --latency 0.5 --workers 4 --rate 5
+    cd mlops_team && python benchmarks/bench_kma_fetch.py --failure-rate 0.1 --skip-serial
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+from data.wearher.v1_0_0.fake_kma import FakeKMAServer
+
+
+def run_serial(fetch, date_ranges):
+    return [fetch(start_time, end_time) for start_time, end_time in date_ranges]
+
+
+def run_concurrent(fetch_windows, fetch, date_ranges, args):
+    return [
+        df for _, _, df in fetch_windows(
+            date_ranges, fetch, max_workers=args.workers, requests_per_second=args.rate,
+            retries=args.retries, backoff=args.backoff
+        )
+    ]
+
+
+def report(label, server, frames, seconds, windows):
+    rows = sum(len(df) for df in frames)
+    print(f"{label:<12} {seconds:7.2f} s  {windows / seconds:6.1f} 구간/s  {rows:>8} 행  "
+          f"요청 {server.requests}회 (실패 {server.failures}회), 연결 {server.connections}개")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, default=5, help='수집할 기간(년, 현재 시각 기준으로 거슬러 올라감)')
+    parser.add_argument('--latency', type=float, default=0.5, help='API 요청 하나당 인위적인 지연(초)')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='503으로 실패시킬 요청 비율')
+    parser.add_argument('--workers', type=int, default=4, help='동시에 보내는 요청 수')
+    parser.add_argument('--rate', type=float, default=5.0, help='초당 최대 요청 수 (0이면 제한 없음)')
+    parser.add_argument('--retries', type=int, default=3, help='구간별 최대 재시도 횟수')
+    parser.add_argument('--backoff', type=float, default=0.1, help='재시도 대기 시간의 기준값(초)')
+    parser.add_argument('--skip-serial', action='store_true', help='기존 방식(순차 요청) 측정을 건너뜀')
+    args = parser.parse_args()
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=365 * args.years)
+
+    with FakeKMAServer(latency=args.latency, failure_rate=args.failure_rate) as server:
+        # 수집 모듈이 import 될 때 API 주소를 읽으므로 대역 서버를 띄운 뒤 import
+        os.environ["KMA_API_URL"] = server.url
+        from data.wearher.v1_0_0.ingest_raw_wearher import fetch_weather_data, generate_date_ranges
+        from data.wearher.v1_0_0.kma_client import get_kma_client
+        from data.wearher.v1_0_0.kma_fetcher import fetch_windows
+
+        date_ranges = generate_date_ranges(start_date, end_date)
+        print(f"{len(date_ranges)}개 구간 ({start_date:%Y-%m-%d} ~ {end_date:%Y-%m-%d}), "
+              f"요청당 지연 {args.latency * 1000:.0f} ms, 실패율 {args.failure_rate:.0%}")
+
+        serial_frames = None
+        if not args.skip_serial:
+            started = time.perf_counter()
+            serial_frames = run_serial(fetch_weather_data, date_ranges)
+            report("순차", server, serial_frames, time.perf_counter() - started, len(date_ranges))
+            server.requests = server.failures = server.connections = 0
+
+        started = time.perf_counter()
+        frames = run_concurrent(fetch_windows, fetch_weather_data, date_ranges, args)
+        report(f"동시 x{args.workers}", server, frames, time.perf_counter() - started, len(date_ranges))
+
+    stats = get_kma_client().stats()
+    print(f"KMAClient: {stats['calls']}회 성공, 평균 {stats['avg_seconds'] * 1000:.0f} ms, "
+          f"최대 {stats['max_seconds'] * 1000:.0f} ms, "
+          f"전송량 {stats['wire_bytes'] / 1e6:.1f} MB (압축 해제 {stats['body_bytes'] / 1e6:.1f} MB)")
+
+    observation_times = [df["ObservationTime"].iloc[0] for df in frames if len(df)]
+    if observation_times != sorted(observation_times):
+        print("FAIL: 구간 결과가 기간 순서대로 나오지 않았습니다.")
+        sys.exit(1)
+    if serial_frames is not None and [len(df) for df in serial_frames] != [len(df) for df in frames]:
+        print("FAIL: 순차 수집과 동시 수집의 결과가 다릅니다.")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+기상청 API 응답 파싱 속도를 비교하는 마이크로벤치마크
+
+여러 해 분량의 kma_sfctm3.php 응답(로컬 대역이 만드는 것과 같은 형식)을
+1. 기존 방식: 문자열로 디코딩 → 줄 나누기 → # 줄 걸러내기 → 다시 합치기 → pd.read_csv(sep=r'\\s+', 타입 추론)
+2. parse_kma_response: bytes를 그대로 C 파서에 넘기고 컬럼 타입/결측값을 미리 지정
+로 파싱해 걸린 시간(중앙값), MB/s, 행/s를 출력하고, 두 결과의 값이 같은지(결측 처리 제외) 확인합니다.
+
+    cd mlops_team && python benchmarks/bench_kma_parse.py --years 5 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+from data.wearher.v1_0_0.fake_kma import make_kma_response
+from data.utils.constants import WEATHER_COLUMNS
+from data.wearher.v1_0_0.kma_parser import parse_kma_response
+
+
+def parse_legacy(body):
+    """ 기존 fetch_weather_data의 파싱 방식 """
+    raw_data = body.decode("utf-8", errors="replace")
+    data_lines = [line for line in raw_data.strip().split("\n") if not line.startswith("#")]
+    return pd.read_csv(StringIO("\n".join(data_lines)), sep=r'\s+', header=None, names=WEATHER_COLUMNS)
+
+
+def measure(parse, body, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        df = parse(body)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), df
+
+
+def same_values(legacy, parsed):
+    """ 결측으로 바뀐 칸을 빼고 두 결과의 값이 같은지 확인합니다. """
+    for column in WEATHER_COLUMNS:
+        missing = parsed[column].isna().to_numpy()
+        expected = legacy[column].to_numpy()[~missing]
+        actual = parsed[column].to_numpy()[~missing]
+        if parsed[column].dtype == object:
+            if not (expected.astype(str) == actual.astype(str)).all():
+                return False
+        elif not np.allclose(expected.astype(float), actual.astype(float)):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, default=5, help='응답 하나에 담을 기간(년)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (중앙값 사용)')
+    args = parser.parse_args()
+
+    end_year = datetime.now().year - 1
+    body = make_kma_response(f"{end_year - args.years + 1}01010000", f"{end_year}12312300")
+    megabytes = len(body) / 1e6
+    print(f"응답 {args.years}년 분량, {megabytes:.1f} MB")
+
+    results = {}
+    for label, parse in (("기존 방식", parse_legacy), ("parse_kma_response", parse_kma_response)):
+        seconds, df = measure(parse, body, args.repeat)
+        results[label] = df
+        print(f"{label:<20} {seconds * 1000:8.1f} ms  {megabytes / seconds:6.1f} MB/s  {len(df) / seconds:>10,.0f} 행/s")
+
+    legacy, parsed = results.values()
+    print(f"결측으로 바뀐 칸: {int(parsed.isna().sum().sum()):,}개")
+    if len(legacy) != len(parsed) or not same_values(legacy, parsed):
+        print("FAIL: 두 파서의 결과가 다릅니다.")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""
+로컬 S3 대역을 붙인 API 서버(src.main:app)에 동시 요청을 보내는 부하 테스트
+
+별도 프로세스로 uvicorn 서버를 띄우고(합성 forecast_*.parquet이 올라간 FakeS3Client 사용),
+/, /forecast/latest, /recommendation/by_day를 정해진 동시성으로 호출해
+처리량(req/s), p50/p95/p99 응답 시간, 그동안 서버가 S3를 호출한 횟수(/metrics 기준)를 출력합니다.
+네트워크(실제 S3) 없이 돌아가므로 배포 전에 서빙 경로의 성능 저하를 확인하는 용도로 씁니다.
+
+    cd mlops_team && python benchmarks/bench_load.py --concurrency 32 --requests 3000
+    cd mlops_team && python benchmarks/bench_load.py --s3-latency 0.2 --max-p99-ms 50
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+import numpy as np
+
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+
+ENDPOINTS = ("/", "/forecast/latest", "/recommendation/by_day")
+
+
+def serve(port, s3_latency, n_files, with_manifest):
+    """ --serve로 실행된 하위 프로세스: 로컬 S3 대역을 주입한 뒤 uvicorn으로 앱을 띄웁니다. """
+    import uvicorn
+    from common import s3_loader
+    from fake_s3 import seeded_client
+
+    s3_loader.set_s3_client(seeded_client(n_files=n_files, latency=s3_latency, with_manifest=with_manifest))
+    uvicorn.run("src.main:app", host="127.0.0.1", port=port, log_level="warning")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args, port, shared_dir):
+    command = [
+        sys.executable, os.path.abspath(__file__), "--serve", "--port", str(port),
+        "--s3-latency", str(args.s3_latency), "--n-files", str(args.n_files),
+    ]
+    if args.no_manifest:
+        command.append("--no-manifest")
+    # 이전 실행(다른 합성 예보)이 남긴 공유 예보 저장소를 이어받지 않도록 실행마다 새 디렉터리 사용
+    # 부하를 한 클라이언트(이 프로세스)에서 보내므로 클라이언트별 속도 제한은 끔 (동시 처리 한도는 그대로)
+    env = {**os.environ, "FORECAST_SHARED_DIR": shared_dir, "ADMISSION_RATE_PER_CLIENT": "0"}
+    return subprocess.Popen(command, cwd=project_path, env=env)
+
+
+async def wait_until_ready(client, server, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"서버 프로세스가 종료되었습니다. (exit code {server.returncode})")
+        try:
+            if (await client.get("/")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise TimeoutError("서버가 시간 안에 준비되지 않았습니다.")
+
+
+async def s3_call_counts(client):
+    """ 서버의 /metrics에서 S3 호출 종류별 누적 횟수를 읽습니다. """
+    text = (await client.get("/metrics")).text
+    pattern = r'^forecast_s3_request_duration_seconds_count\{operation="(\w+)"\} ([0-9.e+]+)$'
+    return {operation: int(float(count)) for operation, count in re.findall(pattern, text, re.MULTILINE)}
+
+
+async def forecast_dates(client):
+    """ 서버가 서빙 중인 예보의 날짜 목록 (by_day 요청에 돌아가며 사용) """
+    response = await client.get("/recommendation/range")
+    response.raise_for_status()
+    return [day["target_date"] for day in response.json()["days"]]
+
+
+def request_plan(endpoints, total, target_dates):
+    dates = itertools.cycle(target_dates)
+    plan = []
+    for endpoint in itertools.islice(itertools.cycle(endpoints), total):
+        params = {"target_date": next(dates)} if endpoint == "/recommendation/by_day" else None
+        plan.append((endpoint, params))
+    return plan
+
+
+async def drive(client, plan, concurrency):
+    """ concurrency개의 작업자가 plan의 요청을 나눠 보내고, (엔드포인트, 상태 코드, 응답 시간) 목록을 반환합니다. """
+    requests = iter(plan)
+    results = []
+
+    async def worker():
+        for endpoint, params in requests:
+            started = time.perf_counter()
+            try:
+                status_code = (await client.get(endpoint, params=params)).status_code
+            except httpx.TransportError:
+                status_code = 0
+            results.append((endpoint, status_code, time.perf_counter() - started))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results
+
+
+def summarize(label, samples, seconds):
+    latencies = np.array([latency for _, _, latency in samples]) * 1000
+    errors = sum(1 for _, status_code, _ in samples if status_code != 200)
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"{label:<24} {len(samples):>6} req {len(samples) / seconds:>9.0f} req/s  "
+          f"p50={p50:6.1f} ms  p95={p95:6.1f} ms  p99={p99:6.1f} ms  errors={errors}")
+    return p99, errors
+
+
+async def run(args):
+    shared_dir = tempfile.TemporaryDirectory(prefix="bench-load-")
+    port = free_port()
+    server = start_server(args, port, shared_dir.name)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30.0) as client:
+            await wait_until_ready(client, server)
+            target_dates = await forecast_dates(client)
+            s3_before = await s3_call_counts(client)
+
+            if args.warmup:
+                await drive(client, request_plan(args.endpoints, args.warmup, target_dates), args.concurrency)
+
+            started = time.perf_counter()
+            results = await drive(client, request_plan(args.endpoints, args.requests, target_dates), args.concurrency)
+            seconds = time.perf_counter() - started
+            s3_after = await s3_call_counts(client)
+    finally:
+        server.terminate()
+        server.wait()
+        shared_dir.cleanup()
+
+    print(f"동시성 {args.concurrency}, 요청 {len(results)}개, {seconds:.2f} s (S3 지연 {args.s3_latency * 1000:.0f} ms)")
+    for endpoint in args.endpoints:
+        summarize(endpoint, [result for result in results if result[0] == endpoint], seconds)
+    p99, errors = summarize("전체", results, seconds)
+
+    s3_calls = {operation: count - s3_before.get(operation, 0) for operation, count in s3_after.items()}
+    print(f"S3 호출 (서버 시작 이후 전체 {sum(s3_after.values())}회 / 측정 중): "
+          + ", ".join(f"{operation}={count}" for operation, count in sorted(s3_calls.items())))
+    return p99, errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--concurrency', type=int, default=32, help='동시에 요청을 보내는 작업자 수')
+    parser.add_argument('--requests', type=int, default=3000, help='측정할 전체 요청 수')
+    parser.add_argument('--warmup', type=int, default=200, help='측정 전에 보내는 요청 수')
+    parser.add_argument('--endpoints', nargs='+', default=list(ENDPOINTS), choices=ENDPOINTS,
+                        help='호출할 엔드포인트 (돌아가며 호출)')
+    parser.add_argument('--s3-latency', type=float, default=0.05, help='S3 호출 한 번당 인위적인 지연(초)')
+    parser.add_argument('--n-files', type=int, default=24, help='버킷에 올려둘 합성 예보 파일 수')
+    parser.add_argument('--no-manifest', action='store_true', help='latest.json 없이 폴더 스캔 경로로 실행')
+    parser.add_argument('--max-p99-ms', type=float, default=None, help='전체 p99가 이 값을 넘으면 실패(exit 1)')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, default=8000, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.s3_latency, args.n_files, not args.no_manifest)
+        return
+
+    p99, errors = asyncio.run(run(args))
+    if errors:
+        print(f"FAIL: 200이 아닌 응답이 {errors}건 있습니다.")
+        sys.exit(1)
+    if args.max_p99_ms is not None and p99 > args.max_p99_ms:
+        print(f"FAIL: 전체 p99 {p99:.1f} ms가 예산({args.max_p99_ms:.0f} ms)을 넘었습니다.")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
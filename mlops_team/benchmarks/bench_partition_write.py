@@ -0,0 +1,113 @@
+"""
+일별 파티션 업로드 처리량을 비교하는 벤치마크
+
+여러 해 분량의 시간별 관측 자료를 일별로 나눈 뒤, S3 대신 PUT마다 지연을 넣은 메모리 파일 시스템에
+1. 기존 방식: 파티션마다 차례로 to_parquet(path, filesystem=fs) 호출 (예전 save_to_s3)
+2. PartitionWriter: 하나의 파일 시스템을 공유하며 작업자 스레드로 병렬 업로드
+로 저장하고, 걸린 시간과 파티션/s, MB/s를 출력합니다. 두 방식이 같은 파티션을 만들었는지도 확인합니다.
+
+    cd mlops_team && python benchmarks/bench_partition_write.py --years 3 --latency 0.03
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+from fsspec.implementations.memory import MemoryFileSystem
+
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+from data.wearher.v1_0_0.fake_kma import make_kma_response
+
+
+class SlowMemoryFileSystem(MemoryFileSystem):
+    """ 파일을 쓸 때마다 latency초씩 기다리는 메모리 파일 시스템 (S3 PUT 왕복 시간 흉내) """
+
+    latency = 0.0
+
+    def pipe_file(self, path, value, *args, **kwargs):
+        time.sleep(self.latency)
+        return super().pipe_file(path, value, *args, **kwargs)
+
+    def _open(self, path, mode="rb", *args, **kwargs):
+        if "w" in mode:
+            time.sleep(self.latency)
+        return super()._open(path, mode, *args, **kwargs)
+
+
+def make_day_partitions(ingest, years):
+    end_year = datetime.now().year - 1
+    body = make_kma_response(f"{end_year - years + 1}01010000", f"{end_year}12312300")
+    df = ingest.add_time_columns(ingest.parse_kma_response(body))
+    return [
+        (int(year), int(month), int(day), group_df.drop(columns=['year', 'month', 'day']))
+        for (year, month, day), group_df in df.groupby(['year', 'month', 'day'])
+    ]
+
+
+def new_filesystem(latency):
+    fs = SlowMemoryFileSystem(skip_instance_cache=True)
+    fs.latency = latency
+    fs.store.clear()
+    return fs
+
+
+def run_serial(ingest, partitions, fs):
+    written_bytes = 0
+    for year, month, day, df in partitions:
+        path = ingest.partition_path(year, month, day)
+        df.to_parquet(path, index=False, engine='pyarrow', filesystem=fs)
+        written_bytes += fs.size(path)
+    return written_bytes
+
+
+def run_parallel(ingest, partitions, fs, max_workers):
+    with ingest.PartitionWriter(fs, max_workers=max_workers) as writer:
+        for year, month, day, df in partitions:
+            writer.submit(df, ingest.partition_path(year, month, day))
+    if writer.failures:
+        raise ingest.PartitionWriteError(writer.failures)
+    return writer.stats()["bytes"]
+
+
+def written_rows(fs):
+    paths = [path for path in fs.find("/") if path.endswith("data.parquet")]
+    return len(paths), sum(len(pd.read_parquet(path, filesystem=fs)) for path in paths)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--years', type=int, default=3, help='저장할 기간(년)')
+    parser.add_argument('--latency', type=float, default=0.03, help='PUT 하나당 인위적인 지연(초)')
+    parser.add_argument('--workers', type=int, default=16, help='PartitionWriter 작업자 수')
+    args = parser.parse_args()
+
+    os.environ.setdefault("S3_BUCKET_NAME", "bench")
+    from data.wearher.v1_0_0 import ingest_raw_wearher as ingest
+
+    partitions = make_day_partitions(ingest, args.years)
+    print(f"일별 파티션 {len(partitions)}개, PUT 지연 {args.latency * 1000:.0f} ms")
+
+    results = []
+    for label, run in (
+        ("기존 방식", lambda fs: run_serial(ingest, partitions, fs)),
+        (f"PartitionWriter({args.workers})", lambda fs: run_parallel(ingest, partitions, fs, args.workers)),
+    ):
+        fs = new_filesystem(args.latency)
+        started = time.perf_counter()
+        written_bytes = run(fs)
+        seconds = time.perf_counter() - started
+        results.append(written_rows(fs))
+        print(f"{label:<22} {seconds:7.2f} s  {len(partitions) / seconds:8.1f} 파티션/s  "
+              f"{written_bytes / 1e6 / seconds:6.2f} MB/s")
+
+    if results[0] != results[1]:
+        print("FAIL: 두 방식이 저장한 파티션이 다릅니다.")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+추천 로직의 행 단위 호출(기존 방식)과 배열 단위 호출(batch)을 비교하는 마이크로벤치마크
+두 방식의 결과가 같은지도 함께 확인합니다.
+
+    cd mlops_team && python benchmarks/bench_recommender.py --rows 200000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+sys.path.append(os.path.join(project_path, 'test'))
+from common.recommender import TEMP_BUCKETS, LAYERING_TIPS, generate_recommendations, generate_recommendation_indices
+from clothing_rules import get_cloth_sense, get_cloth_sense_batch
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000, help='추천을 계산할 행(시간) 수')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    temps = np.round(rng.normal(15, 10, args.rows), 1)
+    diffs = np.round(rng.uniform(0, 15, args.rows), 1)
+
+    scalar, scalar_seconds = timed(lambda: [generate_recommendations(t, d) for t, d in zip(temps, diffs)])
+    (buckets, layerings), batch_seconds = timed(lambda: generate_recommendation_indices(temps, diffs))
+    assert all(
+        rec == (TEMP_BUCKETS[b]['items'], TEMP_BUCKETS[b]['activity_tip'], LAYERING_TIPS[l])
+        for rec, b, l in zip(scalar, buckets, layerings)
+    )
+    print(f"generate_recommendations: 행 단위 {scalar_seconds * 1000:.0f} ms / 배열 단위 {batch_seconds * 1000:.1f} ms "
+          f"({scalar_seconds / batch_seconds:.0f}x)")
+
+    scalar, scalar_seconds = timed(lambda: [get_cloth_sense(t) for t in temps])
+    batch, batch_seconds = timed(lambda: get_cloth_sense_batch(temps))
+    assert scalar == batch
+    print(f"get_cloth_sense:          행 단위 {scalar_seconds * 1000:.0f} ms / 배열 단위 {batch_seconds * 1000:.1f} ms "
+          f"({scalar_seconds / batch_seconds:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
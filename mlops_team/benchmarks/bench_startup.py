@@ -0,0 +1,115 @@
+"""
+API 워커의 콜드 스타트 시간을 재는 벤치마크
+
+1. python -X importtime으로 src.main을 import 하는 데 걸리는 시간과, 그중 오래 걸리는 모듈을 출력합니다.
+   boto3/numpy/pandas/pyarrow처럼 예보를 처음 불러올 때까지 미뤄둔 무거운 모듈이 시작 경로에 다시 들어오면 실패합니다.
+2. uvicorn 프로세스를 띄워 / 에 처음 응답할 때까지의 시간을 잽니다.
+
+import 시간이나 첫 응답 시간이 예산을 넘으면 exit 1로 끝납니다.
+
+    cd mlops_team && python benchmarks/bench_startup.py --import-budget-ms 800 --ready-budget-ms 2000
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+from bench_load import free_port
+
+# 시작 경로(import 시점)에서 불러오면 안 되는 무거운 모듈
+DEFERRED_MODULES = ("boto3", "numpy", "pandas", "pyarrow")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)$")
+
+
+def measure_imports(module):
+    """ 새 인터프리터에서 module을 import 하고 (전체 시간(us), [(누적 us, 자체 us, 모듈 이름)])을 반환합니다. """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_path, capture_output=True, text=True, check=True
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            entries.append((int(cumulative_us), int(self_us), name))
+    total_us = next(cumulative for cumulative, _, name in reversed(entries) if name == module)
+    return total_us, entries
+
+
+def measure_ready(timeout=30.0):
+    """ uvicorn을 띄운 뒤 / 가 처음 200을 돌려줄 때까지의 시간(초)을 반환합니다. """
+    port = free_port()
+    # 미리 불러오기는 백그라운드 작업이라 첫 응답과 무관하므로, 인증 정보 없이 띄울 수 있게 끔
+    env = {**os.environ, "FORECAST_PREWARM": "false"}
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=project_path, env=env
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"서버 프로세스가 종료되었습니다. (exit code {server.returncode})")
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/", timeout=1.0).status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.TransportError:
+                pass
+            time.sleep(0.01)
+        raise TimeoutError("서버가 시간 안에 준비되지 않았습니다.")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--module', default='src.main', help='import 시간을 잴 모듈')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (중앙값 사용)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 느린 모듈 수')
+    parser.add_argument('--import-budget-ms', type=float, default=1000.0, help='import 시간 허용 최대치(ms)')
+    parser.add_argument('--ready-budget-ms', type=float, default=3000.0, help='/ 첫 응답까지 허용 최대치(ms)')
+    args = parser.parse_args()
+
+    runs = [measure_imports(args.module) for _ in range(args.repeat)]
+    import_ms = statistics.median(total for total, _ in runs) / 1000
+    _, entries = runs[-1]
+    imported = {name for _, _, name in entries}
+
+    print(f"import {args.module}: {import_ms:.0f} ms (중앙값, {args.repeat}회)")
+    print("누적 시간이 긴 최상위 모듈:")
+    top_level = sorted(((cumulative, name) for cumulative, _, name in entries if '.' not in name), reverse=True)
+    for cumulative_us, name in top_level[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    ready_ms = statistics.median(measure_ready() for _ in range(args.repeat)) * 1000
+    print(f"uvicorn 시작 → / 첫 응답: {ready_ms:.0f} ms (중앙값, {args.repeat}회)")
+
+    failures = []
+    eager = [module for module in DEFERRED_MODULES if module in imported]
+    if args.module == 'src.main' and eager:
+        failures.append(f"시작 경로에서 무거운 모듈을 import 합니다: {', '.join(eager)}")
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import 시간 {import_ms:.0f} ms가 예산({args.import_budget_ms:.0f} ms)을 넘었습니다.")
+    if ready_ms > args.ready_budget_ms:
+        failures.append(f"첫 응답 시간 {ready_ms:.0f} ms가 예산({args.ready_budget_ms:.0f} ms)을 넘었습니다.")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# 벤치마크용 로컬 S3 대역
+# boto3 S3 클라이언트 중 서빙 경로(common/s3_loader.py)가 사용하는 메서드만 메모리 위에서 흉내냅니다.
+# 네트워크 없이 돌아가며, 호출 횟수와 인위적인 지연(latency)을 조절할 수 있습니다.
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from botocore.exceptions import ClientError
+
+
+class FakeBody:
+    def __init__(self, data):
+        self._data = data
+
+    def read(self):
+        return self._data
+
+
+class FakePaginator:
+    """ boto3 paginator처럼 ContinuationToken을 따라가며 페이지를 하나씩 돌려줍니다. """
+
+    def __init__(self, operation):
+        self._operation = operation
+
+    def paginate(self, **kwargs):
+        token = None
+        while True:
+            page = self._operation(**kwargs, **({"ContinuationToken": token} if token else {}))
+            yield page
+            if not page.get("IsTruncated"):
+                return
+            token = page["NextContinuationToken"]
+
+
+class FakeS3Client:
+    """ list_objects_v2 / get_object / head_object / put_object만 지원하는 메모리 기반 S3 클라이언트 """
+
+    def __init__(self, latency=0.0):
+        self.objects = {}  # key -> (body, etag, last_modified)
+        self.latency = latency
+        self.calls = Counter()
+        self._lock = threading.Lock()
+        self._last_modified = datetime.min
+
+    def _record(self, name):
+        with self._lock:
+            self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _get(self, key):
+        if key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey", "Message": key}}, "GetObject")
+        return self.objects[key]
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self._record("put_object")
+        data = Body.encode() if isinstance(Body, str) else bytes(Body)
+        etag = f'"{hashlib.md5(data).hexdigest()}"'
+        # 연달아 올려도 LastModified 순서가 업로드 순서와 같도록 보장
+        with self._lock:
+            self._last_modified = max(datetime.now(), self._last_modified + timedelta(microseconds=1))
+            self.objects[Key] = (data, etag, self._last_modified)
+        return {"ETag": etag}
+
+    def list_objects_v2(self, Bucket, Prefix="", MaxKeys=1000, ContinuationToken=None, **kwargs):
+        self._record("list_objects_v2")
+        keys = sorted(key for key in self.objects if key.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start:start + MaxKeys]
+        response = {"KeyCount": len(page), "IsTruncated": start + MaxKeys < len(keys)}
+        if page:
+            response["Contents"] = [
+                {"Key": key, "ETag": self.objects[key][1], "LastModified": self.objects[key][2],
+                 "Size": len(self.objects[key][0])}
+                for key in page
+            ]
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + MaxKeys)
+        return response
+
+    def get_paginator(self, operation_name):
+        return FakePaginator(getattr(self, operation_name))
+
+    def head_object(self, Bucket, Key, **kwargs):
+        self._record("head_object")
+        data, etag, modified = self._get(Key)
+        return {"ETag": etag, "ContentLength": len(data), "LastModified": modified}
+
+    def get_object(self, Bucket, Key, **kwargs):
+        self._record("get_object")
+        data, etag, modified = self._get(Key)
+        if kwargs.get("IfNoneMatch") == etag:
+            raise ClientError(
+                {"Error": {"Code": "304", "Message": "Not Modified"},
+                 "ResponseMetadata": {"HTTPStatusCode": 304}},
+                "GetObject"
+            )
+        return {"Body": FakeBody(data), "ETag": etag, "ContentLength": len(data), "LastModified": modified}
+
+
+# scripts/inference.py의 predict()와 같은 형태의 합성 예보 Parquet 바이트를 만듭니다.
+def make_forecast_parquet(start=None, horizon=168, seed=0):
+    start = start or datetime.now().replace(minute=0, second=0, microsecond=0)
+    future_times = [start + timedelta(hours=i + 1) for i in range(horizon)]
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'year': [t.year for t in future_times],
+        'month': [t.month for t in future_times],
+        'day': [t.day for t in future_times],
+        'hour': [t.hour for t in future_times],
+        'day_of_week': [t.strftime('%A') for t in future_times],
+        'pred_Temperature': np.round(rng.normal(15, 8, horizon), 1),
+        'datetime': future_times})
+    buffer = BytesIO()
+    df.to_parquet(buffer, index=False, engine='pyarrow')
+    return buffer.getvalue()
+
+
+# 예보 manifest(latest.json)를 scripts/inference.publish_latest_manifest와 같은 형태로 올립니다.
+def put_latest_manifest(client, prefix, key, rows=168):
+    manifest = {
+        "key": key,
+        "etag": client.objects[key][1],
+        "rows": rows,
+        "horizon": rows,
+        "created_at": datetime.now().isoformat(timespec='seconds'),
+    }
+    client.put_object(Bucket="local", Key=f"{prefix}latest.json", Body=json.dumps(manifest))
+
+
+# 예보 파일 n_files개가 올라가 있는 FakeS3Client를 만듭니다.
+# with_manifest=False면 manifest 없이 폴더 스캔 경로를 타게 됩니다.
+def seeded_client(prefix="data/weather/inference/", n_files=1, latency=0.0, with_manifest=True):
+    client = FakeS3Client()
+    for i in range(n_files):
+        key = f"{prefix}forecast_{datetime(2025, 6, 1) + timedelta(hours=i):%Y%m%d_%H%M}.parquet"
+        client.put_object(Bucket="local", Key=key, Body=make_forecast_parquet(seed=i))
+    if with_manifest and n_files:
+        put_latest_manifest(client, prefix, key)
+    client.calls.clear()
+    client.latency = latency
+    return client
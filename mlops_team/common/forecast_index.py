@@ -0,0 +1,75 @@
+# 날짜별 예보 요약 인덱스 (FastAPI 서버, Streamlit가 공통으로 사용함)
+# 예보 버전이 바뀔 때 한 번만 만들어두고, 요청마다 DataFrame을 다시 필터링/집계하지 않도록 합니다.
+from common.recommender import (
+    TEMP_BUCKETS, TEMP_BUCKET_NAMES, LAYERING_TIPS, generate_recommendation_indices, temp_bucket_indices
+)
+
+
+# 하루치 요약값과 추천 번호(구간/레이어링팁)로 /recommendation/by_day 응답 형태의 딕셔너리를 만듭니다.
+# 온도는 unit 단위의 반올림하지 않은 값을 받고, 응답에 담을 때만 소수 둘째 자리로 반올림합니다.
+def build_daily_payload(target_date, avg_temp, min_temp, max_temp, bucket_index, layering_index,
+                        sensitivity="normal", unit="C"):
+    temp_diff = max_temp - min_temp
+    temp_range_data = TEMP_BUCKETS[bucket_index]
+    return {
+        "target_date": target_date,
+        "sensitivity": sensitivity,
+        "unit": unit,
+        "weather_summary": {
+            "avg_temp": round(float(avg_temp), 2),
+            "min_temp": round(float(min_temp), 2),
+            "max_temp": round(float(max_temp), 2),
+            "temp_difference": round(float(temp_diff), 2)
+        },
+        "recommendations": {
+            "styles": temp_range_data['items'],
+            "activity_tip": temp_range_data['activity_tip'],
+            "layering_tip": LAYERING_TIPS[layering_index]
+        }
+    }
+
+
+# 예보 DataFrame 전체를 groupby 한 번으로 집계하고, 모든 날짜의 추천 구간도 배열 단위로 한 번에 구해
+# {date: 날짜별 요약} 인덱스를 반환합니다.
+# 요약에는 반올림하지 않은 평균/최저/최고 기온(°C)과 기본 응답(보통 민감도, °C)인 payload가 들어 있어서,
+# 민감도/단위를 바꾼 응답도 반올림 전 값으로 추천을 고릅니다. (common/personalization.py)
+# 반환된 딕셔너리들은 여러 요청이 공유하므로 수정하면 안 됩니다.
+def build_daily_index(df):
+    daily_stats = df.groupby('date')['pred_Temperature'].agg(['mean', 'min', 'max'])
+    bucket_indices, layering_indices = generate_recommendation_indices(
+        daily_stats['mean'], daily_stats['max'] - daily_stats['min']
+    )
+    return {
+        target_date: {
+            "target_date": target_date,
+            "avg_temp": float(avg_temp),
+            "min_temp": float(min_temp),
+            "max_temp": float(max_temp),
+            "payload": build_daily_payload(target_date, avg_temp, min_temp, max_temp, int(bucket), int(layering))
+        }
+        for target_date, avg_temp, min_temp, max_temp, bucket, layering in zip(
+            daily_stats.index, daily_stats['mean'], daily_stats['min'], daily_stats['max'],
+            bucket_indices, layering_indices
+        )
+    }
+
+
+# 예보의 시간별 기온 구간을 컬럼 단위 표로 만들어 /recommendation/hourly 응답 형태의 딕셔너리로 반환합니다.
+# 각 시간에는 추천 블록 id(기온 구간 번호)만 두고, 추천 내용은 표에 나온 구간만 한 번씩 recommendations에 담습니다.
+def build_hourly_table(df):
+    bucket_ids = temp_bucket_indices(df['pred_Temperature']).tolist()
+    return {
+        "hours": {
+            "datetime": df['datetime'].dt.strftime('%Y-%m-%dT%H:%M:%S').tolist(),
+            "temperature": df['pred_Temperature'].tolist(),
+            "recommendation_id": bucket_ids
+        },
+        "recommendations": {
+            str(bucket_id): {
+                "temp_range": TEMP_BUCKET_NAMES[bucket_id],
+                "styles": TEMP_BUCKETS[bucket_id]['items'],
+                "activity_tip": TEMP_BUCKETS[bucket_id]['activity_tip']
+            }
+            for bucket_id in sorted(set(bucket_ids))
+        }
+    }
@@ -0,0 +1,119 @@
+# 한 서버(호스트) 안의 여러 프로세스(uvicorn 워커들, Streamlit)가 함께 쓰는 로컬 예보 저장소
+# 예보 버전마다 S3에서 한 번만 받아 Arrow IPC 파일로 써두고, 각 프로세스는 그 파일을 메모리 맵으로 읽습니다.
+# 관측소마다 디렉터리(와 락)가 따로 있어서, 한 관측소를 갱신하는 동안 다른 관측소는 기다리지 않습니다.
+#
+#   {FORECAST_SHARED_DIR}/station-<id>/forecast-<etag>.arrow  예보 테이블 (버전별, 한 번 쓰면 바뀌지 않음)
+#   {FORECAST_SHARED_DIR}/station-<id>/current.json            현재 버전을 가리키는 포인터 (+ 마지막으로 S3에서 확인한 시각)
+#   {FORECAST_SHARED_DIR}/station-<id>/refresh.lock            S3 갱신을 한 프로세스만 하도록 거는 파일 락
+import json
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없는 환경에서는 공유 저장소를 쓰지 않음
+    fcntl = None
+
+# 빈 값으로 설정하면 공유 저장소를 끄고 프로세스마다 따로 S3에서 받습니다.
+FORECAST_SHARED_DIR = os.getenv("FORECAST_SHARED_DIR", os.path.join(tempfile.gettempdir(), "weather-forecast"))
+
+_POINTER_NAME = "current.json"
+_LOCK_NAME = "refresh.lock"
+# 다른 프로세스가 아직 맵핑하고 있을 수 있으므로 직전 버전 파일까지는 남겨둠
+_KEEP_VERSIONS = 2
+
+
+def is_enabled():
+    return bool(FORECAST_SHARED_DIR) and fcntl is not None
+
+
+def _station_dir(station_id):
+    return os.path.join(FORECAST_SHARED_DIR, f"station-{int(station_id)}")
+
+
+def _path(station_id, name):
+    return os.path.join(_station_dir(station_id), name)
+
+
+def _table_name(etag):
+    return f"forecast-{re.sub(r'[^0-9A-Za-z-]', '', etag)}.arrow"
+
+
+# 같은 디렉터리에 임시 파일로 다 쓴 뒤 rename 하므로, 읽는 쪽은 항상 완성된 파일만 봅니다.
+def _atomic_write(station_id, name, write):
+    fd, tmp_path = tempfile.mkstemp(dir=_station_dir(station_id), prefix=f".{name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, _path(station_id, name))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def has_station(station_id):
+    """ 관측소의 디렉터리가 이미 있는지 (한 번이라도 예보를 받아 올린 관측소인지) """
+    return os.path.isdir(_station_dir(station_id))
+
+
+@contextmanager
+def refresh_lock(station_id):
+    """ 호스트 전체에서 한 프로세스만 관측소의 S3 갱신/파일 쓰기를 하도록 막는 락 (다른 프로세스는 끝날 때까지 대기) """
+    os.makedirs(_station_dir(station_id), exist_ok=True)
+    with open(_path(station_id, _LOCK_NAME), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def read_current(station_id):
+    """ 관측소의 현재 버전 포인터(key, etag, file, verified_at)를 반환합니다. 아직 없으면 None """
+    try:
+        with open(_path(station_id, _POINTER_NAME), "rb") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def load_table(station_id, pointer):
+    """ 포인터가 가리키는 Arrow IPC 파일을 메모리 맵으로 열어 복사 없이 테이블로 읽습니다. """
+    import pyarrow as pa
+
+    # 테이블의 버퍼가 맵핑된 메모리를 그대로 가리키므로 source는 닫지 않음 (테이블이 사라질 때 같이 해제)
+    source = pa.memory_map(_path(station_id, pointer["file"]), "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def publish(station_id, key, etag, table, verified_at):
+    """ 새 버전이면 테이블 파일을 쓰고, 현재 버전 포인터를 갱신합니다. refresh_lock() 안에서 호출해야 합니다. """
+    import pyarrow as pa
+
+    table_name = _table_name(etag)
+    if not os.path.exists(_path(station_id, table_name)):
+        def write_table(f):
+            with pa.ipc.new_file(f, table.schema) as writer:
+                writer.write_table(table)
+        _atomic_write(station_id, table_name, write_table)
+
+    pointer = {"key": key, "etag": etag, "file": table_name, "verified_at": verified_at}
+    _atomic_write(station_id, _POINTER_NAME, lambda f: f.write(json.dumps(pointer).encode("utf-8")))
+    _remove_old_tables(station_id, keep=table_name)
+
+
+def _remove_old_tables(station_id, keep):
+    table_files = sorted(
+        (name for name in os.listdir(_station_dir(station_id)) if name.startswith("forecast-") and name.endswith(".arrow")),
+        key=lambda name: os.path.getmtime(_path(station_id, name)),
+        reverse=True
+    )
+    old_files = [name for name in table_files if name != keep][_KEEP_VERSIONS - 1:]
+    for name in old_files:
+        # 이미 맵핑한 프로세스는 파일이 지워져도 계속 읽을 수 있음
+        try:
+            os.unlink(_path(station_id, name))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,99 @@
+# 서빙 경로 관측 지표 (FastAPI /metrics 엔드포인트에서 Prometheus 형식으로 노출)
+# 응답 지연이 S3 때문인지, Parquet 디코딩/pandas 변환 때문인지 구분할 수 있도록 단계별로 나눠 기록합니다.
+# 지표는 프로세스 단위로 집계됩니다.
+from prometheus_client import Counter, Gauge, Histogram
+
+# 캐시된 본문을 돌려주는 ms 단위 응답부터 콜드 로딩(수 초)까지 구분되도록 잡은 구간
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "API 요청 처리 시간 (라우트별)",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+S3_REQUEST_SECONDS = Histogram(
+    "forecast_s3_request_duration_seconds",
+    "예보 로딩 중 S3 호출 시간 (본문 다운로드 포함)",
+    ["operation"],  # list, get_manifest, get_forecast
+    buckets=LATENCY_BUCKETS,
+)
+
+S3_READ_BYTES = Counter(
+    "forecast_s3_read_bytes",
+    "예보 로딩 중 S3에서 내려받은 바이트 수",
+    ["object"],  # manifest, forecast
+)
+
+FORECAST_CACHE_REQUESTS = Counter(
+    "forecast_cache_requests",
+    "API 요청이 메모리의 예보 스냅샷을 바로 썼는지(hit), 불러올 때까지 기다렸는지(miss)",
+    ["result"],
+)
+
+FORECAST_REVALIDATIONS = Counter(
+    "forecast_revalidations",
+    "예보 갱신 결과 (unchanged: S3 확인 결과 그대로, reloaded: S3에서 새로 받음, shared: 다른 프로세스가 받아둔 버전 사용)",
+    ["result"],
+)
+
+PARQUET_DECODE_SECONDS = Histogram(
+    "forecast_parquet_decode_duration_seconds",
+    "내려받은 예보 Parquet을 Arrow 테이블로 읽고 전처리하는 시간",
+    buckets=LATENCY_BUCKETS,
+)
+
+SNAPSHOT_BUILD_SECONDS = Histogram(
+    "forecast_snapshot_build_duration_seconds",
+    "Arrow 테이블을 pandas DataFrame으로 바꾸고 날짜별 인덱스를 만드는 시간",
+    buckets=LATENCY_BUCKETS,
+)
+
+FORECAST_VERSION = Gauge(
+    "forecast_version_info",
+    "관측소별로 현재 서빙 중인 예보 파일 (값은 항상 1, 캐시에서 밀려나면 사라짐)",
+    ["station", "key", "etag"],
+)
+
+FORECAST_AGE_SECONDS = Gauge(
+    "forecast_age_seconds",
+    "캐시된 관측소 예보 중 최신임을 확인한 지 가장 오래된 것의 경과 시간(초), 아직 없으면 NaN",
+)
+
+FORECAST_CACHED_STATIONS = Gauge(
+    "forecast_cached_stations",
+    "메모리에 예보 스냅샷이 올라와 있는 관측소 수",
+)
+
+FORECAST_CACHE_BYTES = Gauge(
+    "forecast_cache_bytes",
+    "메모리에 올라와 있는 관측소 예보 스냅샷들의 추정 크기 합(바이트)",
+)
+
+FORECAST_CACHE_EVICTIONS = Counter(
+    "forecast_cache_evictions",
+    "관측소 수(stations)나 크기(bytes) 한도 때문에 캐시에서 밀려난 관측소 예보 수",
+    ["reason"],
+)
+
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_requests",
+    "입장 제어로 거절한 요청 수 (rate_limited: 클라이언트별 한도 초과 → 429, overloaded: 서버 포화 → 503)",
+    ["reason"],
+)
+
+ADMISSION_QUEUED = Counter(
+    "admission_queued_requests",
+    "동시 처리 한도에 걸려 자리가 날 때까지 대기한 요청 수",
+)
+
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight_requests",
+    "동시 처리 한도가 걸린 라우트에서 처리 중인 요청 수",
+)
+
+ADMISSION_WAITING = Gauge(
+    "admission_waiting_requests",
+    "동시 처리 한도에 걸려 지금 대기 중인 요청 수",
+)
@@ -0,0 +1,64 @@
+# 추위/더위 민감도와 온도 단위에 맞춘 날짜별 추천 (FastAPI 서버, Streamlit가 공통으로 사용함)
+import os
+from functools import lru_cache
+from typing import Literal
+
+from common.forecast_index import build_daily_payload
+from common.recommender import recommendation_indices
+
+# 민감도별 체감 온도 보정값(°C) (Streamlit 대시보드의 민감도 슬라이더와 같은 값)
+SENSITIVITY_ADJUSTMENTS = {
+    "very_cold": 3,
+    "cold": 1.5,
+    "normal": 0,
+    "hot": -1.5,
+    "very_hot": -3,
+}
+# API 파라미터 타입 (FastAPI가 이 값들만 받도록 검증)
+Sensitivity = Literal["very_cold", "cold", "normal", "hot", "very_hot"]
+TempUnit = Literal["C", "F"]
+
+# 예보 버전 하나에서 기억해둘 (날짜, 민감도, 단위) 조합 수
+PERSONALIZED_CACHE_SIZE = int(os.getenv("PERSONALIZED_CACHE_SIZE", "256"))
+
+
+def _to_unit(temp, unit):
+    return temp * 9 / 5 + 32 if unit == "F" else temp
+
+
+# 날짜별 인덱스의 요약(반올림하지 않은 °C 값)을 민감도/단위에 맞춘 응답으로 만듭니다.
+# 추천은 보정한 평균 기온(°C)과 일교차로 고르므로 단위만 바꿔서는 추천이 달라지지 않고,
+# 요약 온도는 보정 후 요청한 단위로 바꿔 응답에 담을 때만 반올림합니다.
+def personalize_daily_payload(summary, sensitivity="normal", unit="C"):
+    adjustment = SENSITIVITY_ADJUSTMENTS[sensitivity]
+    avg_temp = summary["avg_temp"] + adjustment
+    min_temp = summary["min_temp"] + adjustment
+    max_temp = summary["max_temp"] + adjustment
+    # 같은 값만큼 옮기므로 일교차는 그대로
+    bucket_index, layering_index = recommendation_indices(avg_temp, max_temp - min_temp)
+    return build_daily_payload(
+        summary["target_date"], _to_unit(avg_temp, unit), _to_unit(min_temp, unit), _to_unit(max_temp, unit),
+        bucket_index, layering_index, sensitivity, unit
+    )
+
+
+def _build_personalized_lookup(snapshot):
+    daily_index = snapshot.daily_index
+
+    @lru_cache(maxsize=PERSONALIZED_CACHE_SIZE)
+    def lookup(target_date, sensitivity, unit):
+        return personalize_daily_payload(daily_index[target_date], sensitivity, unit)
+
+    return lookup
+
+
+# 스냅샷(예보 버전)의 target_date 추천을 민감도/단위에 맞춰 반환합니다. 예보에 없는 날짜면 None
+# 결과는 스냅샷마다 크기가 제한된 LRU에 기억되며, 예보 버전이 바뀌면 스냅샷과 함께 통째로 버려집니다.
+# 반환된 딕셔너리는 여러 요청이 공유하므로 수정하면 안 됩니다.
+def personalized_daily_payload(snapshot, target_date, sensitivity="normal", unit="C"):
+    if target_date not in snapshot.daily_index:
+        return None
+    if sensitivity == "normal" and unit == "C":
+        return snapshot.daily_index[target_date]["payload"]
+    lookup = snapshot.derive("personalized_daily", _build_personalized_lookup)
+    return lookup(target_date, sensitivity, unit)
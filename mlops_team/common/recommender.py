@@ -1,4 +1,6 @@
 # 옷추천 로직 (FastAPI 서버, Streamlit가 공통으로 사용함)
+# numpy는 배열 단위 함수에서만 불러옴 (API 워커 시작 경로에 넣지 않기 위해)
+from bisect import bisect_left, bisect_right
 
 # 스타일별 추천 데이터를 딕셔너리로 정리
 STYLE_RECOMMENDATIONS = {
@@ -54,29 +56,67 @@ STYLE_RECOMMENDATIONS = {
     }
 }
 
+# 평균 기온 구간표: 기온이 TEMP_BUCKET_UPPER_BOUNDS[i] 이하인 첫 구간이 TEMP_BUCKET_NAMES[i]
+# (마지막 구간은 상한 없음) → 배열 전체를 np.searchsorted 한 번으로 구간 번호로 바꿀 수 있음
+TEMP_BUCKET_UPPER_BOUNDS = [5, 10, 20, 28]
+TEMP_BUCKET_NAMES = ["5도 이하", "10도 이하", "20도 이하", "28도 이하", "28도 초과"]
+# 구간 번호로 바로 꺼내 쓰는 추천 데이터 (STYLE_RECOMMENDATIONS의 같은 객체를 가리킴)
+TEMP_BUCKETS = [STYLE_RECOMMENDATIONS[name] for name in TEMP_BUCKET_NAMES]
+
+# 일교차 구간표: 일교차가 LAYERING_THRESHOLDS[i] 이상이면 LAYERING_TIPS[i + 1]
+LAYERING_THRESHOLDS = [7, 10]
+LAYERING_TIPS = [
+    "",
+    "🌡️ 일교차가 큰 편이니 얇은 겉옷을 준비하세요.",
+    "🌡️ 일교차가 매우 큽니다! 겉옷을 여러 벌 준비하여 레이어링하세요.",
+]
+
+
+# 평균 기온 배열 → 구간 번호 배열 (TEMP_BUCKETS / TEMP_BUCKET_NAMES의 인덱스)
+def temp_bucket_indices(avg_temps):
+    import numpy as np
+
+    avg_temps = np.asarray(avg_temps, dtype=float)
+    # NaN은 어떤 "이하" 조건도 만족하지 않으므로 if/elif와 똑같이 마지막 구간("28도 초과")으로 감
+    return np.searchsorted(TEMP_BUCKET_UPPER_BOUNDS, avg_temps, side='left')
+
+
+# 일교차 배열 → 레이어링팁 번호 배열 (LAYERING_TIPS의 인덱스)
+def layering_tip_indices(temp_diffs):
+    import numpy as np
+
+    temp_diffs = np.asarray(temp_diffs, dtype=float)
+    indices = np.searchsorted(LAYERING_THRESHOLDS, temp_diffs, side='right')
+    # NaN은 어떤 "이상" 조건도 만족하지 않으므로 팁 없음
+    return np.where(np.isnan(temp_diffs), 0, indices)
+
+
+# 여러 날(또는 여러 시간)의 평균 기온/일교차 배열을 한 번에 추천 번호로 바꿉니다.
+# (구간 번호 배열, 레이어링팁 번호 배열)을 반환하며, 실제 추천 내용은 TEMP_BUCKETS / LAYERING_TIPS에서 꺼냅니다.
+def generate_recommendation_indices(avg_temps, temp_diffs):
+    return temp_bucket_indices(avg_temps), layering_tip_indices(temp_diffs)
+
+
+# 평균 기온과 일교차 하나씩 → (구간 번호, 레이어링팁 번호)
+# 값 하나만 볼 때는 numpy 호출 비용이 더 커서, 같은 구간표를 bisect로 조회합니다.
+def recommendation_indices(avg_temp, temp_diff):
+    if avg_temp != avg_temp:  # NaN
+        bucket_index = len(TEMP_BUCKETS) - 1
+    else:
+        bucket_index = bisect_left(TEMP_BUCKET_UPPER_BOUNDS, avg_temp)
+    # 레이어링팁 (NaN이면 팁 없음)
+    layering_index = bisect_right(LAYERING_THRESHOLDS, temp_diff) if temp_diff == temp_diff else 0
+    return bucket_index, layering_index
+
+
 # 평균 기온과 일교차를 바탕으로 옷 추천, 활동팁, 레이어링팁을 모두 생성하여 반환.
 def generate_recommendations(avg_temp, temp_diff):
-    temp_range_data = None
-    if avg_temp <= 5:
-        temp_range_data = STYLE_RECOMMENDATIONS["5도 이하"]
-    elif avg_temp <= 10:
-        temp_range_data = STYLE_RECOMMENDATIONS["10도 이하"]
-    elif avg_temp <= 20:
-        temp_range_data = STYLE_RECOMMENDATIONS["20도 이하"]
-    elif avg_temp <= 28:
-        temp_range_data = STYLE_RECOMMENDATIONS["28도 이하"]
-    else:
-        temp_range_data = STYLE_RECOMMENDATIONS["28도 초과"]
-    
+    bucket_index, layering_index = recommendation_indices(avg_temp, temp_diff)
+    temp_range_data = TEMP_BUCKETS[bucket_index]
+
     # 옷 추천, 활동팁 가져오기
     style_recs = temp_range_data['items']
     activity_tip = temp_range_data['activity_tip']
-    
-    # 레이어링팁 생성
-    layering_tip = ""
-    if temp_diff >= 10:
-        layering_tip = "🌡️ 일교차가 매우 큽니다! 겉옷을 여러 벌 준비하여 레이어링하세요."
-    elif temp_diff >= 7:
-        layering_tip = "🌡️ 일교차가 큰 편이니 얇은 겉옷을 준비하세요."
-        
-    return style_recs, activity_tip, layering_tip
\ No newline at end of file
+    layering_tip = LAYERING_TIPS[layering_index]
+
+    return style_recs, activity_tip, layering_tip
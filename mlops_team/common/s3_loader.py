@@ -1,52 +1,481 @@
+# boto3, pandas, pyarrow는 import만으로 1초 가까이 걸려서, 처음 실제로 필요할 때 함수 안에서 import 합니다.
+# (API 워커가 켜지자마자 / 에 응답할 수 있도록)
+import json
+import logging
 import os
-import boto3
-import pandas as pd
+import threading
+import time
+from botocore.exceptions import ClientError
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from io import BytesIO
 from dotenv import load_dotenv
 from pathlib import Path
+from common import forecast_store
+from common.forecast_index import build_daily_index
+from common.metrics import (
+    FORECAST_AGE_SECONDS, FORECAST_CACHE_BYTES, FORECAST_CACHE_EVICTIONS, FORECAST_CACHED_STATIONS,
+    FORECAST_REVALIDATIONS, FORECAST_VERSION, PARQUET_DECODE_SECONDS, S3_READ_BYTES, S3_REQUEST_SECONDS,
+    SNAPSHOT_BUILD_SECONDS
+)
+from common.singleflight import SingleFlight
 
-# S3에서 가장 최신 예보 Parquet 파일을 찾아 pandas DataFrame으로 반환합니다.
-# 실패 시 Exception을 발생시킵니다.
-def load_latest_forecast_from_s3():
-    # .env 파일 로드 (이 함수를 호출하는 스크립트의 위치를 기준으로 경로 설정)
-    env_path = Path(__file__).parent.parent.joinpath('.env')
-    load_dotenv(dotenv_path=env_path)
-
-    aws_access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
-    aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-    bucket_name = os.getenv("S3_BUCKET_NAME", "mlops-prj")
-    prefix = "data/weather/inference/"
-
-    if not all([aws_access_key_id, aws_secret_access_key, bucket_name]):
-        raise ValueError("AWS 인증 정보가 .env 파일에 설정되지 않았습니다.")
-
-    s3_client = boto3.client(
-        's3',
-        aws_access_key_id=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-    )
+logger = logging.getLogger(__name__)
+
+# .env 파일 로드 (이 모듈의 위치를 기준으로 경로 설정, import 시 한 번만)
+env_path = Path(__file__).parent.parent.joinpath('.env')
+load_dotenv(dotenv_path=env_path)
+
+FORECAST_PREFIX = "data/weather/inference/"
+# 관측소를 지정하지 않은 요청이 받는 예보 (원천 데이터를 수집하는 관측소, data/utils/constants.KMA_STATION_ID와 같은 값)
+# API/Streamlit 이미지에는 data 패키지가 없으므로 상수를 import 하지 않고 여기서 따로 정합니다.
+# 이 관측소의 예보는 예전처럼 FORECAST_PREFIX 바로 아래에, 나머지는 station=<id>/ 아래에 올라갑니다.
+FORECAST_DEFAULT_STATION_ID = int(os.getenv("FORECAST_DEFAULT_STATION_ID", "108"))
+# scripts/inference.save_predict가 새 예보를 올릴 때마다 함께 갱신하는 최신 예보 포인터
+FORECAST_MANIFEST_NAME = "latest.json"
+
+# 서빙 경로에서 읽는 예보 컬럼과 메모리를 줄이기 위한 Arrow 타입 (None이면 파일의 타입 그대로)
+# JSON 응답 값이 바뀌지 않도록 기온은 float64로 유지합니다.
+FORECAST_COLUMN_TYPES = {
+    'year': 'int16',
+    'month': 'int8',
+    'day': 'int8',
+    'hour': 'int8',
+    'day_of_week': None,  # 읽을 때 dictionary(→ pandas category)로 읽음
+    'pred_Temperature': 'float64',
+    'datetime': None,
+}
+
+# 캐시된 예보를 S3에 다시 확인하지 않고 그대로 돌려주는 시간(초)
+FORECAST_CACHE_TTL = float(os.getenv("FORECAST_CACHE_TTL", "60"))
+
+# S3 다운로드 + Parquet 파싱을 이벤트 루프 밖에서 처리할 전용 스레드 수
+FORECAST_LOADER_MAX_WORKERS = int(os.getenv("FORECAST_LOADER_MAX_WORKERS", "2"))
+
+# 한 프로세스가 메모리에 들고 있을 관측소 예보 수와 전체 크기(바이트) 한도
+# 넘으면 가장 오래 요청되지 않은 관측소부터 버리고, 다음 요청 때 다시 불러옵니다.
+FORECAST_MAX_STATIONS = int(os.getenv("FORECAST_MAX_STATIONS", "32"))
+FORECAST_CACHE_MAX_BYTES = int(os.getenv("FORECAST_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+
+class ForecastNotFoundError(FileNotFoundError):
+    """ 관측소의 예보 폴더에 Parquet 파일이 하나도 없을 때 (예보를 만들지 않는 관측소) """
+
+
+class ForecastSnapshot:
+    """ 관측소 하나의 S3 예보 파일 한 버전(key + ETag)과 전처리가 끝난 Arrow 테이블/DataFrame을 묶어둔 캐시 항목 """
+
+    def __init__(self, key, etag, table, verified_at=None, station_id=FORECAST_DEFAULT_STATION_ID):
+        self.key = key
+        self.etag = etag
+        self.table = table
+        self.station_id = station_id
+        with SNAPSHOT_BUILD_SECONDS.time():
+            # 숫자 컬럼은 가능한 한 Arrow 버퍼(공유 저장소의 메모리 맵 포함)를 복사 없이 그대로 사용
+            self.df = table.to_pandas(split_blocks=True)
+            # 날짜별 요약/추천 인덱스는 버전마다 한 번만 만들고, 스냅샷 교체와 함께 통째로 바뀝니다.
+            self.daily_index = build_daily_index(self.df)
+        # 캐시 크기 한도 계산용 추정치 (Arrow 버퍼 + DataFrame, 복사 없이 공유된 버퍼도 따로 셈)
+        self.nbytes = table.nbytes + int(self.df.memory_usage(deep=True).sum())
+        self.loaded_at = time.time()
+        # 마지막으로 S3에서 "아직 최신"임을 확인한 시각 (다른 프로세스가 확인한 시각일 수도 있음)
+        self.verified_at = verified_at or self.loaded_at
+        # 직렬화된 응답 본문처럼 버전마다 한 번만 만들면 되는 파생 데이터
+        self._artifacts = {}
+        self._artifacts_lock = threading.Lock()
+
+    @property
+    def version(self):
+        return (self.key, self.etag)
+
+    @property
+    def age(self):
+        """ 마지막으로 최신임을 확인한 뒤 지난 시간(초) """
+        return time.time() - self.verified_at
+
+    def derive(self, name, factory):
+        """ 이 버전에 대한 파생 데이터를 처음 요청될 때 한 번만 만들고, 이후에는 만들어둔 값을 반환합니다. """
+        artifact = self._artifacts.get(name)
+        if artifact is None:
+            with self._artifacts_lock:
+                artifact = self._artifacts.get(name)
+                if artifact is None:
+                    artifact = factory(self)
+                    self._artifacts[name] = artifact
+        return artifact
+
+
+class StationSnapshotCache:
+    """
+    관측소별 최신 예보 스냅샷을 들고 있는 LRU 캐시
+    관측소 수(max_stations)나 추정 크기 합(max_bytes)이 한도를 넘으면 가장 오래 요청되지 않은 관측소부터 버립니다.
+    요청 처리(이벤트 루프)와 로더 스레드가 함께 쓰므로 락으로 보호합니다.
+    """
+
+    def __init__(self, max_stations, max_bytes):
+        self.max_stations = max_stations
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._snapshots = OrderedDict()  # station_id -> ForecastSnapshot (뒤쪽일수록 최근에 요청됨)
+        self._lock = threading.Lock()
+
+    def get(self, station_id, touch=False):
+        """ 캐시된 스냅샷(없으면 None). touch=True면 최근에 요청된 관측소로 표시합니다. """
+        with self._lock:
+            snapshot = self._snapshots.get(station_id)
+            if snapshot is not None and touch:
+                self._snapshots.move_to_end(station_id)
+            return snapshot
+
+    def put(self, snapshot):
+        """ 관측소의 스냅샷을 교체(없으면 추가)하고, 한도를 넘으면 오래된 관측소를 버립니다. 교체된 이전 스냅샷 목록을 반환합니다. """
+        with self._lock:
+            previous = self._snapshots.get(snapshot.station_id)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            # 이미 있던 관측소는 순서를 그대로 둠 (백그라운드 갱신은 요청으로 치지 않음)
+            self._snapshots[snapshot.station_id] = snapshot
+            self.nbytes += snapshot.nbytes
+
+            replaced = [previous] if previous is not None else []
+            while len(self._snapshots) > 1:
+                if len(self._snapshots) > self.max_stations:
+                    reason = "stations"
+                elif self.nbytes > self.max_bytes:
+                    reason = "bytes"
+                else:
+                    break
+                # 방금 넣은 관측소는 버리지 않음 (한 관측소만으로 한도를 넘더라도 서빙은 해야 함)
+                station_id = next(sid for sid in self._snapshots if sid != snapshot.station_id)
+                evicted = self._snapshots.pop(station_id)
+                self.nbytes -= evicted.nbytes
+                replaced.append(evicted)
+                FORECAST_CACHE_EVICTIONS.labels(reason).inc()
+
+            FORECAST_CACHED_STATIONS.set(len(self._snapshots))
+            FORECAST_CACHE_BYTES.set(self.nbytes)
+            return replaced
+
+    def snapshots(self):
+        with self._lock:
+            return list(self._snapshots.values())
+
+
+# 프로세스 전체에서 공유하는 캐시 상태
+_snapshot_cache = StationSnapshotCache(FORECAST_MAX_STATIONS, FORECAST_CACHE_MAX_BYTES)
+_manifest_cache = {}  # manifest key -> (manifest의 ETag, 가리키는 예보 파일의 Key/ETag)
+_missing_forecasts = {}  # 예보 파일이 없던 관측소 -> (S3에서 확인한 시각, 에러 메시지)
+_s3_client = None
+_snapshot_warmers = []
+_forecast_flight = SingleFlight()
+_loader_executor = ThreadPoolExecutor(
+    max_workers=FORECAST_LOADER_MAX_WORKERS,
+    thread_name_prefix="forecast-loader"
+)
+
+
+# boto3 클라이언트는 스레드 세이프하므로 한 번만 만들어 재사용합니다.
+def get_s3_client():
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+
+        aws_access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
+        aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+        if not all([aws_access_key_id, aws_secret_access_key]):
+            raise ValueError("AWS 인증 정보가 .env 파일에 설정되지 않았습니다.")
+
+        _s3_client = boto3.client(
+            's3',
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+        )
+    return _s3_client
+
+
+# 다른 S3 클라이언트(로컬 S3 대역 등)를 주입합니다. 벤치마크에서 사용합니다.
+def set_s3_client(s3_client):
+    global _s3_client
+    _s3_client = s3_client
+
+
+# 새 예보 버전을 캐시에 올리기 직전에, 로더 스레드에서 실행할 함수를 등록합니다.
+# 응답 본문 직렬화처럼 버전마다 한 번씩 필요한 작업을 요청 처리 전에 미리 해두는 용도입니다.
+def register_snapshot_warmer(warmer):
+    if warmer not in _snapshot_warmers:
+        _snapshot_warmers.append(warmer)
+
+
+def get_bucket_name():
+    return os.getenv("S3_BUCKET_NAME", "mlops-prj")
+
+
+# 관측소의 예보 폴더 (scripts/inference.save_predict가 올리는 경로와 같은 규칙)
+def forecast_prefix(station_id=FORECAST_DEFAULT_STATION_ID):
+    if station_id == FORECAST_DEFAULT_STATION_ID:
+        return FORECAST_PREFIX
+    return f"{FORECAST_PREFIX}station={station_id}/"
+
+
+# S3 ETag는 따옴표 포함 여부가 도구마다 달라서 따옴표를 뗀 값으로 통일해 비교합니다.
+def _normalize_etag(etag):
+    return etag.strip('"')
+
+
+# manifest(latest.json)가 없을 때 쓰는 대체 경로: 예보 폴더 전체를 페이지 단위로 훑어
+# 가장 최근에 올라온 Parquet 객체를 찾습니다. (객체가 1000개를 넘어도 정확함)
+# 기본 관측소 폴더 아래에 있는 다른 관측소 폴더(station=<id>/)의 파일은 건너뜁니다.
+def _scan_latest_forecast_object(s3_client, bucket_name, prefix):
+    latest_file = None
+    paginator = s3_client.get_paginator('list_objects_v2')
+    with S3_REQUEST_SECONDS.labels("list").time():
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                if not obj['Key'].endswith('.parquet') or '/' in obj['Key'][len(prefix):]:
+                    continue
+                if latest_file is None or obj['LastModified'] > latest_file['LastModified']:
+                    latest_file = obj
+
+    if latest_file is None:
+        raise ForecastNotFoundError(f"S3 버킷 '{bucket_name}'의 '{prefix}' 폴더에 Parquet 파일이 없습니다.")
+    return {'Key': latest_file['Key'], 'ETag': _normalize_etag(latest_file['ETag'])}
+
+
+# 예보 폴더의 latest.json을 읽어 최신 예보 파일의 Key/ETag를 반환합니다. (manifest가 없으면 None)
+# 지난번에 받은 manifest의 ETag로 조건부 GET을 하므로, 바뀌지 않았으면 본문 없이 304만 받습니다.
+def _read_latest_manifest(s3_client, bucket_name, prefix):
+    manifest_key = f"{prefix}{FORECAST_MANIFEST_NAME}"
+    cached = _manifest_cache.get(manifest_key)
+
+    request_kwargs = {'IfNoneMatch': cached[0]} if cached else {}
+    try:
+        with S3_REQUEST_SECONDS.labels("get_manifest").time():
+            obj = s3_client.get_object(Bucket=bucket_name, Key=manifest_key, **request_kwargs)
+            body = obj['Body'].read()
+    except ClientError as e:
+        error_code = e.response.get('Error', {}).get('Code')
+        if error_code in ('304', 'NotModified') and cached:
+            return cached[1]
+        if error_code in ('404', 'NoSuchKey'):
+            return None
+        raise
 
-    response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-    if 'Contents' not in response:
-        raise FileNotFoundError(f"S3 버킷 '{bucket_name}'의 '{prefix}' 폴더에 파일이 없습니다.")
-
-    parquet_files = [obj for obj in response['Contents'] if obj['Key'].endswith('.parquet')]
-    if not parquet_files:
-        raise FileNotFoundError(f"S3 폴더에 Parquet 파일이 없습니다.")
-
-    latest_file = max(parquet_files, key=lambda obj: obj['LastModified'])
-    latest_file_key = latest_file['Key']
-    
-    s3_path = f"s3://{bucket_name}/{latest_file_key}"
-    df = pd.read_parquet(s3_path, storage_options={
-        "key": aws_access_key_id,
-        "secret": aws_secret_access_key,
-    })
-    
-    #  데이터 전처리 로직 
-    df['datetime'] = pd.to_datetime(df[['year', 'month', 'day', 'hour']])
-    df['date'] = df['datetime'].dt.date
-    
-    if 'pred_Temperature' not in df.columns:
+    S3_READ_BYTES.labels("manifest").inc(len(body))
+    manifest = json.loads(body)
+    latest_file = {'Key': manifest['key'], 'ETag': _normalize_etag(manifest['etag'])}
+    _manifest_cache[manifest_key] = (obj['ETag'], latest_file)
+    return latest_file
+
+
+# 가장 최근 예보 Parquet 객체의 Key/ETag를 반환합니다.
+# manifest GET 한 번으로 찾고, manifest가 없을 때만 폴더 전체를 훑습니다.
+def _find_latest_forecast_object(s3_client, bucket_name, prefix):
+    latest_file = _read_latest_manifest(s3_client, bucket_name, prefix)
+    if latest_file is None:
+        latest_file = _scan_latest_forecast_object(s3_client, bucket_name, prefix)
+    return latest_file
+
+
+# 예보 Parquet 파일을 내려받아 전처리한 Arrow 테이블과 실제로 받은 객체의 ETag를 반환합니다.
+# 다운로드 시간과 디코딩 시간은 각각 따로 지표에 기록합니다.
+def _read_forecast_parquet(s3_client, bucket_name, key):
+    with S3_REQUEST_SECONDS.labels("get_forecast").time():
+        obj = s3_client.get_object(Bucket=bucket_name, Key=key)
+        body = obj['Body'].read()
+    S3_READ_BYTES.labels("forecast").inc(len(body))
+
+    with PARQUET_DECODE_SECONDS.time():
+        table = _decode_forecast_parquet(body)
+    return table, _normalize_etag(obj['ETag'])
+
+
+# 서빙에 필요한 컬럼만, 작은 타입으로 읽어 날짜 컬럼을 붙이고 시각 순으로 정렬된 테이블을 만듭니다.
+def _decode_forecast_parquet(body):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(BytesIO(body), read_dictionary=['day_of_week'])
+
+    available_columns = set(parquet_file.schema_arrow.names)
+    if 'pred_Temperature' not in available_columns:
         raise KeyError("Parquet 파일에 필수 컬럼 'pred_Temperature'가 없습니다.")
 
-    return df.sort_values(by='datetime').reset_index(drop=True)
\ No newline at end of file
+    table = parquet_file.read(columns=[column for column in FORECAST_COLUMN_TYPES if column in available_columns])
+    for column, column_type in FORECAST_COLUMN_TYPES.items():
+        if column in available_columns and column_type is not None:
+            table = table.set_column(table.schema.get_field_index(column), column, table[column].cast(column_type))
+
+    if 'datetime' in available_columns:
+        # 예보를 올릴 때 시각 컬럼을 만들어 정렬해 두었으므로 날짜 컬럼만 Arrow에서 바로 계산
+        table = table.append_column('date', pc.cast(table['datetime'], pa.date32()))
+        timestamps = table['datetime']
+        if not pc.all(pc.greater_equal(timestamps[1:], timestamps[:-1])).as_py():
+            table = table.sort_by('datetime')
+    else:
+        # datetime 컬럼이 없는 예전 형식의 예보 파일
+        import pandas as pd
+
+        df = table.to_pandas()
+        df['datetime'] = pd.to_datetime(df[['year', 'month', 'day', 'hour']])
+        df['date'] = df['datetime'].dt.date
+        df = df.sort_values(by='datetime').reset_index(drop=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    return table
+
+
+def _is_fresh(snapshot, max_age):
+    return snapshot is not None and time.time() - snapshot.verified_at < max_age
+
+
+# max_age초 안에 S3에서 예보가 없다고 확인한 관측소면 다시 조회하지 않고 같은 ForecastNotFoundError를 냅니다.
+def _raise_if_recently_missing(station_id, max_age):
+    missing = _missing_forecasts.get(station_id)
+    if missing is not None and time.time() - missing[0] < max_age:
+        raise ForecastNotFoundError(missing[1])
+
+
+# 새 스냅샷에 대해 등록된 준비 작업을 실행하고 관측소의 캐시 항목을 교체합니다.
+def _install_snapshot(snapshot):
+    for warmer in _snapshot_warmers:
+        try:
+            warmer(snapshot)
+        except Exception as e:
+            # 미리 만들지 못한 파생 데이터는 첫 요청 때 다시 만들어지므로 교체는 그대로 진행
+            logger.warning(f"예보 스냅샷 준비 작업 실패 ({warmer.__name__}): {e}")
+    for replaced in _snapshot_cache.put(snapshot):
+        # 교체되거나 캐시에서 밀려난 버전은 지표에서도 내림
+        with suppress(KeyError):
+            FORECAST_VERSION.remove(str(replaced.station_id), replaced.key, replaced.etag)
+    FORECAST_VERSION.labels(str(snapshot.station_id), snapshot.key, snapshot.etag).set(1)
+    return snapshot
+
+
+# 관측소의 최신 예보 Key/ETag를 찾고, 예보가 없었는지(ForecastNotFoundError)를 관측소별로 기억해 둡니다.
+def _find_station_forecast_object(s3_client, bucket_name, station_id):
+    try:
+        latest_file = _find_latest_forecast_object(s3_client, bucket_name, forecast_prefix(station_id))
+    except ForecastNotFoundError as e:
+        _missing_forecasts[station_id] = (time.time(), str(e))
+        raise
+    _missing_forecasts.pop(station_id, None)
+    return latest_file
+
+
+# S3 manifest(또는 목록 조회)로 관측소의 최신 예보 key/ETag를 확인하고, 바뀐 경우에만 파일을 다시 받아 캐시를 교체합니다.
+def _revalidate_from_s3(station_id):
+    snapshot = _snapshot_cache.get(station_id)
+
+    s3_client = get_s3_client()
+    bucket_name = get_bucket_name()
+    latest_file = _find_station_forecast_object(s3_client, bucket_name, station_id)
+
+    if snapshot is not None and snapshot.version == (latest_file['Key'], latest_file['ETag']):
+        snapshot.verified_at = time.time()
+        FORECAST_REVALIDATIONS.labels("unchanged").inc()
+        return snapshot
+
+    table, etag = _read_forecast_parquet(s3_client, bucket_name, latest_file['Key'])
+    FORECAST_REVALIDATIONS.labels("reloaded").inc()
+    return _install_snapshot(ForecastSnapshot(latest_file['Key'], etag, table, station_id=station_id))
+
+
+# 같은 호스트의 다른 프로세스가 이미 받아둔 버전이 있으면 그것을 쓰고,
+# 그 버전도 max_age보다 오래됐을 때만 이 프로세스가 S3를 확인해 결과를 공유 저장소에 남깁니다.
+def _revalidate_via_forecast_store(station_id, max_age):
+    if not forecast_store.has_station(station_id):
+        # 공유 저장소에 아직 없는 관측소는 락(관측소 디렉터리)을 만들기 전에 S3에 예보가 있는지만 가볍게 확인
+        # (예보가 없는 지점번호로 들어온 요청마다 디렉터리가 생기지 않도록, 파일 다운로드는 아래 락 안에서 한 번만)
+        _find_station_forecast_object(get_s3_client(), get_bucket_name(), station_id)
+
+    with forecast_store.refresh_lock(station_id):
+        pointer = forecast_store.read_current(station_id)
+        if pointer is not None:
+            snapshot = _snapshot_cache.get(station_id)
+            if snapshot is None or snapshot.version != (pointer['key'], pointer['etag']):
+                table = forecast_store.load_table(station_id, pointer)
+                snapshot = _install_snapshot(ForecastSnapshot(
+                    pointer['key'], pointer['etag'], table, pointer['verified_at'], station_id=station_id
+                ))
+            else:
+                snapshot.verified_at = max(snapshot.verified_at, pointer['verified_at'])
+            if time.time() - pointer['verified_at'] < max_age:
+                FORECAST_REVALIDATIONS.labels("shared").inc()
+                return snapshot
+
+        snapshot = _revalidate_from_s3(station_id)
+        forecast_store.publish(station_id, snapshot.key, snapshot.etag, snapshot.table, snapshot.verified_at)
+        return snapshot
+
+
+# 관측소의 최신 예보를 확인해 캐시를 갱신합니다.
+# 직접 부르지 말고 _forecast_flight를 통해 호출해야 프로세스 안에서 관측소마다 동시에 한 번만 실행됩니다.
+def _revalidate_forecast_snapshot(station_id, max_age):
+    if forecast_store.is_enabled():
+        try:
+            return _revalidate_via_forecast_store(station_id, max_age)
+        except ForecastNotFoundError:
+            raise
+        except OSError as e:
+            # 공유 디렉터리를 쓸 수 없으면 이 프로세스 혼자 S3에서 받음
+            logger.warning(f"공유 예보 저장소를 사용할 수 없어 S3에서 직접 불러옵니다: {e}")
+    return _revalidate_from_s3(station_id)
+
+
+# 관측소(기본값 FORECAST_DEFAULT_STATION_ID)의 최신 예보 스냅샷을 반환합니다.
+# max_age(기본값 FORECAST_CACHE_TTL)초 안에 확인한 캐시가 있으면 S3에 접근하지 않고,
+# 그보다 오래됐으면 목록 조회 한 번으로 key/ETag를 비교해 바뀐 경우에만 파일을 다시 받습니다.
+# 여러 스레드가 동시에 캐시 미스를 내도 관측소마다 S3 조회는 한 번만 하고, 모두 같은 결과(또는 같은 예외)를 받습니다.
+# 관측소에 예보 파일이 없으면 ForecastNotFoundError가 발생하며, 이 결과도 max_age초 동안 기억해 S3를 다시 조회하지 않습니다.
+def get_latest_forecast_snapshot(max_age=None, station_id=FORECAST_DEFAULT_STATION_ID):
+    if max_age is None:
+        max_age = FORECAST_CACHE_TTL
+    snapshot = _snapshot_cache.get(station_id)
+    if _is_fresh(snapshot, max_age):
+        return snapshot
+    _raise_if_recently_missing(station_id, max_age)
+    return _forecast_flight.do(f"latest:{station_id}", _revalidate_forecast_snapshot, station_id, max_age)
+
+
+# get_latest_forecast_snapshot의 async 버전입니다.
+# 캐시가 유효하면 바로 반환하고, S3/pandas 작업이 필요하면 전용 스레드 풀로 넘겨서
+# FastAPI(uvicorn) 이벤트 루프가 막히지 않도록 합니다.
+# 예보가 새로 올라온 직후처럼 동시에 들어온 요청들은 진행 중인 조회 하나를 함께 기다립니다.
+async def get_latest_forecast_snapshot_async(max_age=None, station_id=FORECAST_DEFAULT_STATION_ID):
+    if max_age is None:
+        max_age = FORECAST_CACHE_TTL
+    snapshot = _snapshot_cache.get(station_id)
+    if _is_fresh(snapshot, max_age):
+        return snapshot
+    _raise_if_recently_missing(station_id, max_age)
+    return await _forecast_flight.do_async(
+        f"latest:{station_id}", _loader_executor, _revalidate_forecast_snapshot, station_id, max_age
+    )
+
+
+# 캐시된 관측소 중 가장 오래 전에 최신임을 확인한 예보의 경과 시간 (갱신이 밀린 관측소가 있는지 보는 용도)
+def _forecast_age():
+    snapshots = _snapshot_cache.snapshots()
+    return max(snapshot.age for snapshot in snapshots) if snapshots else float('nan')
+
+
+FORECAST_AGE_SECONDS.set_function(_forecast_age)
+
+
+# S3에 접근하지 않고 관측소의 현재 캐시된 스냅샷을 그대로 반환합니다. (아직 없거나 캐시에서 밀려났으면 None)
+# 요청 처리에서 부르는 함수이므로 그 관측소를 최근에 요청된 것으로 표시합니다.
+def peek_forecast_snapshot(station_id=FORECAST_DEFAULT_STATION_ID):
+    return _snapshot_cache.get(station_id, touch=True)
+
+
+# 캐시에 올라와 있는 관측소 목록 (오래 요청되지 않은 순서)
+def cached_station_ids():
+    return [snapshot.station_id for snapshot in _snapshot_cache.snapshots()]
+
+
+# S3에서 가장 최신 예보 Parquet 파일을 찾아 pandas DataFrame으로 반환합니다.
+# 반환되는 DataFrame은 캐시와 공유되므로 호출하는 쪽에서 수정하면 안 됩니다.
+# 실패 시 Exception을 발생시킵니다.
+def load_latest_forecast_from_s3(station_id=FORECAST_DEFAULT_STATION_ID):
+    return get_latest_forecast_snapshot(station_id=station_id).df
@@ -0,0 +1,54 @@
+# 같은 작업이 동시에 여러 번 요청될 때 실제 실행은 한 번만 하도록 묶어주는 유틸리티
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    같은 key로 동시에 들어온 호출을 하나의 실행으로 합칩니다.
+    먼저 온 호출이 실제로 실행하고, 그동안 들어온 호출들은 그 결과(또는 같은 예외)를 함께 받습니다.
+    실행이 끝나면 key가 비워지므로 다음 호출은 다시 새로 실행합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> 진행 중인 concurrent.futures.Future
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    # 동기 버전: 먼저 온 스레드가 fn을 직접 실행하고, 나머지 스레드는 결과를 기다립니다.
+    def do(self, key, fn, *args):
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._calls[key] = future
+
+        if is_leader:
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                self._forget(key, future)
+        return future.result()
+
+    # async 버전: fn은 executor에서 실행되고, 기다리는 코루틴들은 이벤트 루프를 막지 않습니다.
+    # 동기 버전으로 이미 진행 중인 실행이 있으면 그 결과를 함께 기다립니다.
+    async def do_async(self, key, executor, fn, *args):
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = executor.submit(fn, *args)
+                self._calls[key] = future
+        if is_leader:
+            # 이미 끝난 future면 콜백이 바로 실행되므로 락 밖에서 등록
+            future.add_done_callback(lambda done: self._forget(key, done))
+        # 기다리던 요청 하나가 취소돼도 공유 중인 실행은 취소되지 않도록 shield
+        return await asyncio.shield(asyncio.wrap_future(future))
@@ -2,7 +2,22 @@ import os
 
 # API 관련 상수
 KMA_STATION_ID = 108
-KMA_API_URL = 'https://apihub.kma.go.kr/api/typ01/url/kma_sfctm3.php'
+# 벤치마크에서는 로컬 대역 서버 주소로 바꿔서 사용
+KMA_API_URL = os.getenv('KMA_API_URL', 'https://apihub.kma.go.kr/api/typ01/url/kma_sfctm3.php')
+
+# 기상청 API 동시 수집 설정 (전체 백필 시 구간들을 병렬로 요청)
+KMA_FETCH_MAX_WORKERS = int(os.getenv('KMA_FETCH_MAX_WORKERS', '4'))  # 동시에 보내는 요청 수
+KMA_REQUESTS_PER_SECOND = float(os.getenv('KMA_REQUESTS_PER_SECOND', '5'))  # API 호출 한도 (0이면 제한 없음)
+KMA_FETCH_RETRIES = int(os.getenv('KMA_FETCH_RETRIES', '3'))  # 일시적인 실패 시 재시도 횟수
+KMA_RETRY_BACKOFF = float(os.getenv('KMA_RETRY_BACKOFF', '1.0'))  # 재시도 대기 시간의 기준값(초), 시도마다 2배씩 늘어남
+
+# 기상청 API 연결 타임아웃(초): 연결 수립 / 응답 대기 (응답이 멈춰도 DAG가 무한정 기다리지 않도록)
+KMA_CONNECT_TIMEOUT = float(os.getenv('KMA_CONNECT_TIMEOUT', '5'))
+KMA_READ_TIMEOUT = float(os.getenv('KMA_READ_TIMEOUT', '60'))
+
+# S3 일별 파티션 저장 설정 (초기 적재 시 수천 개의 파티션을 병렬로 업로드)
+PARTITION_WRITE_MAX_WORKERS = int(os.getenv('PARTITION_WRITE_MAX_WORKERS', '16'))  # 동시에 올리는 파티션 수
+PARTITION_WRITE_RETRIES = int(os.getenv('PARTITION_WRITE_RETRIES', '2'))  # 일시적인 실패 시 재시도 횟수
 
 # 데이터 처리 관련 상수
 LOOKBACK_DAYS = 30  # 피처 생성 시 참조할 과거 데이터 기간
@@ -0,0 +1,153 @@
+# 벤치마크/테스트용 기상청 API(kma_sfctm3.php) 로컬 대역
+# tm1~tm2 구간의 시간별 관측 자료를 실제 응답과 같은 형태(# 주석 줄 + 공백으로 정렬된 46개 컬럼)로 만들어 돌려줍니다.
+# 네트워크 없이 돌아가며, 응답 지연과 일시적인 실패(503) 비율을 조절할 수 있습니다.
+# Accept-Encoding에 gzip이 있으면 압축해서 보내고, 새로 맺은 연결 수를 세어 keep-alive 여부를 확인할 수 있습니다.
+import gzip
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+KMA_PATH = "/api/typ01/url/kma_sfctm3.php"
+
+_HEADER = """#START7777
+#--------------------------------------------------------------------------------------------------
+#  기상청 지상관측 시간자료 [입력인수형태][예] ?tm1=201512110100&tm2=201512140000&stn=0&help=1
+#--------------------------------------------------------------------------------------------------
+# YYMMDDHHMI STN  WD   WS GST  GST  GST     PA     PS PT    PR    TA    TD    HM    PV     RN     RN     RN     RN     SD     SD     SD WC WP WW                      CA  CA   CH CT         CT  CT  CT    VS   SS    SI ST    TS    TE    TE    TE    TE  ST   WH  BF IR IX
+#        KST  ID  16  m/s  WD   WS   TM    hPa    hPa  -   hPa     C     C     %   hPa     mm    DAY    JUN    INT    HR3    DAY    TOT -- -- --                      TOT MID  MIN            TOP MID LOW                     GD     C   0.05   0.1   0.2   0.3 SEA    m  --  -- --
+"""
+_FOOTER = "#7777END\n"
+
+# 구름 형태(CT)는 문자열, 없으면 "-"
+_CLOUD_TYPES = ("-", "Sc", "ScAc", "StNs", "Ci", "CuSc")
+
+
+def _kma_times(tm1, tm2):
+    start = datetime.strptime(tm1, "%Y%m%d%H%M")
+    end = datetime.strptime(tm2, "%Y%m%d%H%M")
+    hours = int((end - start).total_seconds() // 3600) + 1
+    return [start + timedelta(hours=i) for i in range(max(hours, 0))]
+
+
+@lru_cache(maxsize=512)
+def make_kma_response(tm1, tm2, stn=108):
+    """ tm1~tm2(YYYYMMDDHHMM) 구간의 시간별 관측 자료를 kma_sfctm3.php 응답 형식의 bytes로 만듭니다. """
+    times = _kma_times(tm1, tm2)
+    rng = np.random.default_rng(int(tm1) % (2 ** 32))
+    lines = [_HEADER]
+    for t in times:
+        hour_of_year = t.timetuple().tm_yday * 24 + t.hour
+        temperature = 12 - 14 * np.cos(2 * np.pi * hour_of_year / 8760) + rng.normal(0, 2)
+        rain = rng.random() < 0.1
+        # 결측은 실제 응답처럼 -9 / -9.0 / -99.0 / "-"로 표시
+        fields = [
+            t.strftime("%Y%m%d%H%M"), str(stn),
+            str(int(rng.integers(0, 37))), f"{rng.uniform(0, 8):.1f}",
+            "-9", "-9.0", "-9",
+            f"{rng.normal(1010, 8):.1f}", f"{rng.normal(1020, 8):.1f}",
+            str(int(rng.integers(0, 9))), f"{rng.normal(0, 1):.1f}",
+            f"{temperature:.1f}" if rng.random() > 0.002 else "-99.0", f"{temperature - rng.uniform(0, 10):.1f}",
+            f"{rng.uniform(20, 100):.1f}", f"{rng.uniform(1, 30):.1f}",
+            f"{rng.uniform(0, 5):.1f}" if rain else "-9.0", f"{rng.uniform(0, 30):.1f}" if rain else "-9.0",
+            "-9.0", "-9.0", "-9.0", "-9.0", "-9.0",
+            "-9", "-9", str(int(rng.integers(0, 100))) if rain else "-",
+            str(int(rng.integers(0, 11))), str(int(rng.integers(0, 11))), str(int(rng.integers(0, 30))),
+            _CLOUD_TYPES[int(rng.integers(0, len(_CLOUD_TYPES)))],
+            "-9", "-9", "-9",
+            str(int(rng.integers(100, 5000))), f"{rng.uniform(0, 1):.1f}", f"{rng.uniform(0, 3):.2f}",
+            "-9", f"{temperature + rng.normal(0, 3):.1f}",
+            f"{temperature:.1f}", f"{temperature:.1f}", f"{temperature:.1f}", f"{temperature:.1f}",
+            "-9", "-9.0", "-9", "3", "1",
+        ]
+        lines.append(" ".join(field.rjust(5) for field in fields) + "\n")
+    lines.append(_FOOTER)
+    return "".join(lines).encode("utf-8")
+
+
+@lru_cache(maxsize=512)
+def make_gzipped_kma_response(tm1, tm2, stn=108):
+    return gzip.compress(make_kma_response(tm1, tm2, stn), mtime=0)
+
+
+class FakeKMAServer:
+    """
+    make_kma_response로 응답하는 로컬 HTTP 서버 (with 문으로 켜고 끔)
+
+    latency: 요청 하나당 인위적인 지연(초)
+    failure_rate: 503(Retry-After 없음)으로 실패시킬 요청 비율
+    """
+
+    def __init__(self, latency=0.0, failure_rate=0.0, seed=0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.failures = 0
+        self.connections = 0
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{KMA_PATH}"
+
+    def _handler_class(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive 허용
+
+            def setup(self):
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+                with fake._lock:
+                    fake.requests += 1
+                    fail = fake._rng.random() < fake.failure_rate
+                    fake.failures += fail
+                if fake.latency:
+                    time.sleep(fake.latency)
+
+                if parsed.path != KMA_PATH or "tm1" not in query or "tm2" not in query:
+                    self._send(400, b"bad request")
+                elif fail:
+                    self._send(503, b"temporarily unavailable")
+                elif "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = make_gzipped_kma_response(query["tm1"], query["tm2"], int(query.get("stn", 108)))
+                    self._send(200, body, {"Content-Encoding": "gzip"})
+                else:
+                    self._send(200, make_kma_response(query["tm1"], query["tm2"], int(query.get("stn", 108))))
+
+            def _send(self, status, body, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
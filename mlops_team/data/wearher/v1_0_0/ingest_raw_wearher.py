@@ -1,7 +1,6 @@
-import requests
-from io import StringIO
+import json
+from collections import deque
 import pandas as pd
-import requests
 from tqdm import tqdm
 from dotenv import load_dotenv
 import os
@@ -14,11 +13,13 @@ sys.path.append(
 )
 from data.utils.constants import (
     KMA_STATION_ID,
-    KMA_API_URL,
-    WEATHER_COLUMNS,
-    WEATHER_KOREAN_COLUMNS,
+    PARTITION_WRITE_MAX_WORKERS,
     LOOKBACK_DAYS,
 )
+from data.wearher.v1_0_0.kma_client import KMAClient, get_kma_client
+from data.wearher.v1_0_0.kma_fetcher import fetch_windows
+from data.wearher.v1_0_0.kma_parser import coerce_kma_columns, parse_kma_response
+from data.wearher.v1_0_0.partition_writer import PartitionWriter, PartitionWriteError
 
 load_dotenv()
 
@@ -34,38 +35,24 @@ AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
 AWS_DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
 S3_BUCKET_NAME = os.getenv('S3_BUCKET_NAME')
 
-def fetch_weather_data(start_datetime: str, end_datetime: str) -> pd.DataFrame:
+# 수집이 중간에 멈췄을 때 다시 시작할 지점을 남기는 파일
+INGEST_CHECKPOINT_PATH = f"{S3_BUCKET_NAME}/data/weather/ingest/checkpoint.json"
+
+def fetch_weather_data(start_datetime: str, end_datetime: str, client: KMAClient = None) -> pd.DataFrame:
     """
     기상청 API에서 날씨 데이터를 가져옵니다.
     
     Args:
         start_datetime (str): 시작 날짜/시간 (YYYYMMDDHHMM 형식)
         end_datetime (str): 종료 날짜/시간 (YYYYMMDDHHMM 형식)
+        client (KMAClient): 요청에 쓸 클라이언트 (생략하면 연결을 재사용하는 프로세스 공용 클라이언트)
     
     Returns:
         pd.DataFrame: 가져온 날씨 데이터
     """
-    api_params = {
-        "tm1": start_datetime,
-        "tm2": end_datetime,
-        "stn": KMA_STATION_ID,
-        "authKey": os.getenv('AUTH_KEY'),
-        "help": 0
-    }
-    
-    response = requests.get(KMA_API_URL, params=api_params)
-    raw_data = response.text
-    
-    use_korean_columns = False
-    
-    data_lines = [line for line in raw_data.strip().split("\n") if not line.startswith("#")]
-    
-    return pd.read_csv(
-        StringIO("\n".join(data_lines)),
-        sep=r'\s+',
-        header=None,
-        names= WEATHER_KOREAN_COLUMNS if use_korean_columns else WEATHER_COLUMNS
-    )
+    client = client or get_kma_client()
+    # 응답 bytes를 그대로 파싱 (결측값은 NaN/None으로 바뀜)
+    return parse_kma_response(client.fetch(start_datetime, end_datetime, KMA_STATION_ID))
 
 def generate_date_ranges(start_date: datetime, end_date: datetime) -> list:
     """
@@ -120,40 +107,152 @@ def get_latest_weather_data() -> datetime:
         print(f"S3에서 최신 데이터 확인 중 오류 발생: {e}")
         return datetime(2000, 1, 1)
 
-def save_to_s3(df: pd.DataFrame, year: int, month: int, day: int):
+def partition_path(year: int, month: int, day: int) -> str:
     """
-    데이터프레임을 S3에 저장합니다.
+    일별 원천 데이터가 저장되는 S3 경로를 반환합니다.
+    """
+    return f"{S3_BUCKET_NAME}/data/weather/raw/year={year:04d}/month={month:02d}/day={day:02d}/data.parquet"
+
+def read_checkpoint(s3: s3fs.S3FileSystem) -> datetime:
+    """
+    중단된 수집의 재시작 지점을 반환합니다. 진행 중이던 수집이 없으면 None
     """
-    s3 = s3fs.S3FileSystem()
-    path = f"{S3_BUCKET_NAME}/data/weather/raw/year={year:04d}/month={month:02d}/day={day:02d}/data.parquet"
     try:
-        df.to_parquet(path, index=False, engine='pyarrow', filesystem=s3)
-    except Exception as e:
-        print(f"S3 저장 중 오류 발생: {e}")
+        checkpoint = json.loads(s3.cat(INGEST_CHECKPOINT_PATH))
+    except FileNotFoundError:
+        return None
+    return datetime.strptime(checkpoint["resume_from"], '%Y%m%d%H%M')
+
+def write_checkpoint(s3: s3fs.S3FileSystem, resume_from: datetime):
+    """
+    resume_from 이전의 날짜는 모두 저장되었음을 기록합니다. (다시 시작하면 resume_from부터 수집)
+    """
+    checkpoint = {
+        "resume_from": resume_from.strftime('%Y%m%d%H%M'),
+        "updated_at": datetime.now().isoformat(timespec='seconds'),
+    }
+    s3.pipe(INGEST_CHECKPOINT_PATH, json.dumps(checkpoint).encode('utf-8'))
+
+def clear_checkpoint(s3: s3fs.S3FileSystem):
+    """
+    수집이 끝까지 완료되면 재시작 지점을 지웁니다.
+    """
+    if s3.exists(INGEST_CHECKPOINT_PATH):
+        s3.rm(INGEST_CHECKPOINT_PATH)
+
+def add_time_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    관측 시각을 datetime으로 바꾸고 year/month/day/hour 컬럼을 추가합니다.
+    """
+    df['ObservationTime'] = pd.to_datetime(df['ObservationTime'].astype(str), format='%Y%m%d%H%M')
+    df['year'] = df['ObservationTime'].dt.year
+    df['month'] = df['ObservationTime'].dt.month
+    df['day'] = df['ObservationTime'].dt.day
+    df['hour'] = df['ObservationTime'].dt.hour
+    return df
+
+def _merge_existing_partition(s3: s3fs.S3FileSystem, df: pd.DataFrame, year: int, month: int, day: int) -> pd.DataFrame:
+    # 하루 중간부터 수집한 경우(시간별 업데이트, 재시작) 이미 저장된 앞 시간대와 합쳐서 덮어씀
+    path = partition_path(year, month, day)
+    if not s3.exists(path):
+        return df
+    # 예전 파서로 저장된 파티션이면 컬럼 타입/결측 표현을 새 파서와 맞춘 뒤 합침
+    existing = coerce_kma_columns(pd.read_parquet(path, filesystem=s3))
+    merged = pd.concat([existing, df.drop(columns=['year', 'month', 'day'])], ignore_index=True)
+    return merged.drop_duplicates(subset='ObservationTime', keep='last').sort_values('ObservationTime')
+
+def _submit_day(writer: PartitionWriter, day_df: pd.DataFrame, merge_existing: bool):
+    # 하루치 데이터를 그날의 파티션에 올리도록 예약 (year/month/day는 경로에 들어가므로 컬럼에서는 뺌)
+    year, month, day = (int(value) for value in day_df[['year', 'month', 'day']].iloc[0])
+    if merge_existing:
+        day_df = _merge_existing_partition(writer.s3, day_df, year, month, day)
+    return writer.submit(day_df.drop(columns=['year', 'month', 'day'], errors='ignore'), partition_path(year, month, day))
+
+def _advance_checkpoint(s3: s3fs.S3FileSystem, checkpoints: deque):
+    # 앞선 구간들의 파티션이 모두 저장된 만큼만 체크포인트를 옮김 (실패한 구간이 있으면 그 앞에서 멈춤)
+    resume_from = None
+    while checkpoints and all(future.done() and future.result() for future in checkpoints[0][1]):
+        resume_from, _ = checkpoints.popleft()
+    if resume_from is not None:
+        write_checkpoint(s3, resume_from)
+
+def ingest_weather_stream(date_ranges: list, desc: str, s3: s3fs.S3FileSystem = None,
+                          max_workers: int = PARTITION_WRITE_MAX_WORKERS) -> int:
+    """
+    날짜 구간들을 받아오는 대로 일별로 나누어 S3에 저장합니다. (수집 → 파싱 → 일별 분할 → 저장)
+    전체 기간을 메모리에 모으지 않고, 다음 구간에 이어질 수 있는 마지막 날짜만 남겨두고 나머지 날짜는 바로 저장합니다.
+    일별 파티션은 하나의 파일 시스템을 공유하는 PartitionWriter로 병렬 업로드합니다.
+    구간마다 저장이 끝난 지점을 체크포인트로 남기므로, 중간에 실패해도 다시 실행하면 그 지점부터 이어서 수집합니다.
+
+    Args:
+        date_ranges (list): (시작날짜, 종료날짜) 튜플의 리스트 (generate_date_ranges의 결과)
+        desc (str): 진행 표시줄에 보여줄 설명
+        s3 (s3fs.S3FileSystem): 저장에 쓸 파일 시스템 (생략하면 새로 만듦)
+        max_workers (int): 동시에 업로드할 파티션 수
+
+    Returns:
+        int: 저장한 일별 파티션 수
+
+    Raises:
+        PartitionWriteError: 재시도 후에도 저장하지 못한 파티션이 있을 때 (체크포인트는 그 앞에 남음)
+    """
+    s3 = s3 or s3fs.S3FileSystem()
+    pending = None  # 아직 저장하지 않은 마지막 날짜의 데이터
+    first_day = True
+    checkpoints = deque()  # (재시작 지점, 그 지점 이전 날짜들의 업로드 future 목록)
+
+    with PartitionWriter(s3, max_workers=max_workers) as writer:
+        for _, end_time, df in tqdm(fetch_windows(date_ranges, fetch_weather_data), total=len(date_ranges), desc=desc):
+            futures = []
+            if len(df):
+                df = add_time_columns(df)
+                if pending is not None:
+                    df = pd.concat([pending, df], ignore_index=True)
+                days = [group_df for _, group_df in df.groupby(['year', 'month', 'day'], sort=True)]
+                pending = days.pop()
+                for group_df in days:
+                    futures.append(_submit_day(writer, group_df, first_day))
+                    first_day = False
+
+            # 남겨둔 날짜의 처음부터(없으면 다음 구간부터) 다시 받으면 되도록 기록
+            if pending is not None:
+                resume_from = pending['ObservationTime'].min().replace(hour=0)
+            else:
+                resume_from = datetime.strptime(end_time, '%Y%m%d%H%M') + timedelta(hours=1)
+            checkpoints.append((resume_from, futures))
+            _advance_checkpoint(s3, checkpoints)
+            if writer.failures:
+                break
+
+        if pending is not None and not writer.failures:
+            _submit_day(writer, pending, first_day)
+        writer.wait()
+        _advance_checkpoint(s3, checkpoints)
+
+    stats = writer.stats()
+    logger.info(
+        f"파티션 {stats['partitions']}개 저장 ({stats['bytes'] / 1e6:.1f} MB, "
+        f"{stats['partitions_per_second']:.1f} 파티션/s, {stats['mb_per_second']:.1f} MB/s, 실패 {stats['failures']}개)"
+    )
+    if writer.failures:
+        raise PartitionWriteError(writer.failures)
+    clear_checkpoint(s3)
+    return stats['partitions']
 
 def initialize_weather_database():
     """
     전체 날씨 데이터를 가져와 S3에 저장합니다.
+    이전 수집이 중간에 멈췄다면 체크포인트부터 이어서 수집합니다.
     """
-    start_date = datetime(2000, 1, 1)
+    s3 = s3fs.S3FileSystem()
+    start_date = read_checkpoint(s3)
+    if start_date is not None:
+        print(f"중단된 수집을 {start_date:%Y-%m-%d %H:%M}부터 이어서 진행합니다.")
+    else:
+        start_date = datetime(2000, 1, 1)
     end_date = datetime.now()
     date_ranges = generate_date_ranges(start_date, end_date)
-    
-    weather_data_frames = []
-    for start_time, end_time in tqdm(date_ranges, desc="날씨 데이터 수집 중"):
-        weather_data_frames.append(fetch_weather_data(start_time, end_time))
-    
-    combined_data = pd.concat(weather_data_frames)
-    combined_data['ObservationTime'] = pd.to_datetime(combined_data['ObservationTime'], format='%Y%m%d%H%M')
-    combined_data['year'] = combined_data['ObservationTime'].dt.year
-    combined_data['month'] = combined_data['ObservationTime'].dt.month
-    combined_data['day'] = combined_data['ObservationTime'].dt.day
-    combined_data['hour'] = combined_data['ObservationTime'].dt.hour
-    
-    # 일별로 데이터를 나누어 S3에 저장
-    for (year, month, day), group_df in tqdm(combined_data.groupby(['year', 'month', 'day'])):
-        group_df.drop(columns=['year', 'month', 'day'], inplace=True)
-        save_to_s3(group_df, year, month, day)
+    ingest_weather_stream(date_ranges, desc="날씨 데이터 수집 중", s3=s3)
 
 def update_weather_database():
     """
@@ -168,23 +267,7 @@ def update_weather_database():
         return
     
     date_ranges = generate_date_ranges(start_time, end_time)
-    weather_data_frames = []
-    
-    for start_time, end_time in tqdm(date_ranges, desc="날씨 데이터 업데이트 중"):
-        weather_data_frames.append(fetch_weather_data(start_time, end_time))
-    
-    if weather_data_frames:
-        new_data = pd.concat(weather_data_frames)
-        new_data['ObservationTime'] = pd.to_datetime(new_data['ObservationTime'], format='%Y%m%d%H%M')
-        new_data['year'] = new_data['ObservationTime'].dt.year
-        new_data['month'] = new_data['ObservationTime'].dt.month
-        new_data['day'] = new_data['ObservationTime'].dt.day
-        new_data['hour'] = new_data['ObservationTime'].dt.hour
-        
-        # 일별로 데이터를 나누어 S3에 저장
-        for (year, month, day), group_df in new_data.groupby(['year', 'month', 'day']):
-            group_df.drop(columns=['year', 'month', 'day'], inplace=True)
-            save_to_s3(group_df, year, month, day)
+    ingest_weather_stream(date_ranges, desc="날씨 데이터 업데이트 중")
 
 def check_s3_path_exists() -> bool:
     """
@@ -203,7 +286,10 @@ def collect_weather_data_with_time():
     """
     S3에 weather 데이터가 없으면 초기화하고, 있으면 업데이트합니다.
     """
-    if check_s3_path_exists():
+    if read_checkpoint(s3fs.S3FileSystem()) is not None:
+        print("중단된 날씨 데이터 수집이 있어 이어서 진행합니다.")
+        initialize_weather_database()
+    elif check_s3_path_exists():
         print("기존 날씨 데이터가 발견되어 업데이트를 시작합니다.")
         update_weather_database()
     else:
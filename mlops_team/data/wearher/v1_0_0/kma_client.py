@@ -0,0 +1,113 @@
+import logging
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from data.utils.constants import (
+    KMA_API_URL,
+    KMA_CONNECT_TIMEOUT,
+    KMA_FETCH_MAX_WORKERS,
+    KMA_READ_TIMEOUT,
+    KMA_STATION_ID,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class KMAClient:
+    """
+    기상청 API(kma_sfctm3.php) 클라이언트입니다.
+    세션 하나를 재사용해 연결(TCP+TLS)을 유지하고, gzip으로 압축된 응답을 받으며,
+    모든 요청에 연결/응답 타임아웃을 겁니다. 호출마다 걸린 시간과 받은 바이트 수를 기록합니다.
+    여러 스레드(fetch_windows의 작업자)가 함께 써도 됩니다.
+    """
+
+    def __init__(self, url: str = KMA_API_URL, auth_key: str = None, pool_size: int = KMA_FETCH_MAX_WORKERS,
+                 connect_timeout: float = KMA_CONNECT_TIMEOUT, read_timeout: float = KMA_READ_TIMEOUT):
+        self.url = url
+        self.auth_key = auth_key or os.getenv('AUTH_KEY')
+        self.timeout = (connect_timeout, read_timeout)
+
+        self.session = requests.Session()
+        # 동시에 요청하는 작업자 수만큼 연결을 열어두고 재사용 (재시도는 fetch_windows에서 처리)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size), max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.wire_bytes = 0  # 네트워크로 받은 바이트 수 (압축된 크기)
+        self.body_bytes = 0  # 압축을 푼 응답 본문 바이트 수
+
+    def fetch(self, start_datetime: str, end_datetime: str, station_id: int = KMA_STATION_ID) -> bytes:
+        """
+        관측소의 시간별 관측 자료를 요청해 응답 본문(bytes)을 반환합니다.
+
+        Args:
+            start_datetime (str): 시작 날짜/시간 (YYYYMMDDHHMM 형식)
+            end_datetime (str): 종료 날짜/시간 (YYYYMMDDHHMM 형식)
+            station_id (int): 관측소 지점번호
+
+        Returns:
+            bytes: 응답 본문 (# 주석 줄 + 공백으로 구분된 관측 자료)
+        """
+        api_params = {
+            "tm1": start_datetime,
+            "tm2": end_datetime,
+            "stn": station_id,
+            "authKey": self.auth_key,
+            "help": 0
+        }
+        started = time.perf_counter()
+        response = self.session.get(self.url, params=api_params, timeout=self.timeout)
+        # 429/5xx 등은 예외로 올려서 fetch_windows가 재시도할 수 있게 함
+        response.raise_for_status()
+        body = response.content
+        elapsed = time.perf_counter() - started
+
+        wire_bytes = int(response.headers.get("Content-Length", len(body)))
+        with self._lock:
+            self.calls += 1
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+            self.wire_bytes += wire_bytes
+            self.body_bytes += len(body)
+        logger.debug(
+            f"KMA {start_datetime}~{end_datetime}: {elapsed * 1000:.0f} ms, "
+            f"{wire_bytes} bytes ({response.headers.get('Content-Encoding', 'identity')})"
+        )
+        return body
+
+    def stats(self) -> dict:
+        """ 지금까지의 호출 횟수, 평균/최대 응답 시간(초), 받은 바이트 수 """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "avg_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+                "max_seconds": self.max_seconds,
+                "wire_bytes": self.wire_bytes,
+                "body_bytes": self.body_bytes,
+            }
+
+    def close(self):
+        self.session.close()
+
+
+_kma_client = None
+_kma_client_lock = threading.Lock()
+
+
+# 시간별 업데이트와 백필이 함께 쓰는 프로세스 공용 클라이언트 (처음 쓸 때 한 번만 만듦)
+def get_kma_client() -> KMAClient:
+    global _kma_client
+    if _kma_client is None:
+        with _kma_client_lock:
+            if _kma_client is None:
+                _kma_client = KMAClient()
+    return _kma_client
@@ -0,0 +1,147 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from data.utils.constants import (
+    KMA_FETCH_MAX_WORKERS,
+    KMA_FETCH_RETRIES,
+    KMA_REQUESTS_PER_SECOND,
+    KMA_RETRY_BACKOFF,
+)
+
+logger = logging.getLogger(__name__)
+
+# 다시 시도하면 성공할 수 있는 HTTP 상태 코드 (호출 한도 초과, 서버 일시 장애)
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    여러 스레드가 함께 쓰는 토큰 버킷입니다.
+    초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓이며, 토큰이 없으면 생길 때까지 기다립니다.
+    """
+
+    def __init__(self, rate: float, burst: float = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """ 토큰 하나를 씁니다. rate가 0 이하이면 기다리지 않습니다. """
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            # 토큰을 미리 예약해두고(음수 허용) 락 밖에서 기다리므로, 기다리는 순서대로 토큰이 돌아갑니다.
+            self._tokens -= 1
+            wait_seconds = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """ 연결 실패, 타임아웃, 429/5xx 응답처럼 다시 시도할 만한 에러인지 확인합니다. """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in TRANSIENT_STATUS_CODES
+    return False
+
+
+def _retry_after_seconds(error: Exception) -> float:
+    # 429/503 응답에 Retry-After(초)가 있으면 그만큼은 기다림
+    response = getattr(error, "response", None)
+    if response is None:
+        return 0.0
+    try:
+        return float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        return 0.0
+
+
+def fetch_with_retry(fetch, start_datetime: str, end_datetime: str, rate_limiter: TokenBucket,
+                     retries: int = KMA_FETCH_RETRIES, backoff: float = KMA_RETRY_BACKOFF):
+    """
+    호출 한도를 지키면서 fetch(start_datetime, end_datetime)를 실행하고, 일시적인 실패는 재시도합니다.
+    재시도 전에는 backoff * 2^시도횟수초(+ 무작위 지연)만큼 기다립니다.
+
+    Args:
+        fetch: 구간 하나를 받아오는 함수 (예: fetch_weather_data)
+        start_datetime (str): 시작 날짜/시간 (YYYYMMDDHHMM 형식)
+        end_datetime (str): 종료 날짜/시간 (YYYYMMDDHHMM 형식)
+        rate_limiter (TokenBucket): 요청을 보내기 전에 토큰을 받을 버킷
+        retries (int): 최대 재시도 횟수
+        backoff (float): 재시도 대기 시간의 기준값(초)
+
+    Returns:
+        fetch의 반환값
+    """
+    for attempt in range(retries + 1):
+        rate_limiter.acquire()
+        try:
+            return fetch(start_datetime, end_datetime)
+        except Exception as e:
+            if attempt == retries or not is_transient_error(e):
+                raise
+            delay = max(backoff * 2 ** attempt + random.uniform(0, backoff), _retry_after_seconds(e))
+            logger.warning(
+                f"{start_datetime}~{end_datetime} 구간 수집 실패, {delay:.1f}초 후 재시도합니다 "
+                f"({attempt + 1}/{retries}): {e}"
+            )
+            time.sleep(delay)
+
+
+def fetch_windows(date_ranges: list, fetch, max_workers: int = KMA_FETCH_MAX_WORKERS,
+                  requests_per_second: float = KMA_REQUESTS_PER_SECOND,
+                  retries: int = KMA_FETCH_RETRIES, backoff: float = KMA_RETRY_BACKOFF):
+    """
+    여러 날짜 구간을 동시에 받아오되, 결과는 date_ranges 순서대로 하나씩 돌려줍니다.
+    전체 요청 속도는 requests_per_second로 제한되고, 일시적인 실패는 구간별로 재시도합니다.
+    아직 소비되지 않은 결과는 최대 max_workers * 2개까지만 미리 받아두므로 메모리 사용량이 일정합니다.
+    재시도 후에도 실패한 구간이 있으면 그 구간 차례에 예외가 발생하고, 남은 요청은 취소됩니다.
+
+    Args:
+        date_ranges (list): (시작날짜, 종료날짜) 튜플의 리스트 (generate_date_ranges의 결과)
+        fetch: 구간 하나를 받아오는 함수 (예: fetch_weather_data)
+        max_workers (int): 동시에 보내는 최대 요청 수
+        requests_per_second (float): 초당 최대 요청 수 (0이면 제한 없음)
+        retries (int): 구간별 최대 재시도 횟수
+        backoff (float): 재시도 대기 시간의 기준값(초)
+
+    Yields:
+        tuple: (시작날짜, 종료날짜, fetch의 반환값)
+    """
+    rate_limiter = TokenBucket(requests_per_second, burst=max(1, min(max_workers, requests_per_second)))
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kma-fetch")
+    windows = iter(date_ranges)
+    pending = deque()
+
+    def submit_next():
+        window = next(windows, None)
+        if window is not None:
+            future = executor.submit(fetch_with_retry, fetch, *window, rate_limiter, retries, backoff)
+            pending.append((window, future))
+
+    try:
+        for _ in range(max_workers * 2):
+            submit_next()
+        while pending:
+            (start_datetime, end_datetime), future = pending.popleft()
+            result = future.result()
+            submit_next()
+            yield start_datetime, end_datetime, result
+    finally:
+        # 실패했거나 호출한 쪽이 중간에 멈춘 경우, 아직 시작하지 않은 요청은 보내지 않음
+        # (Airflow 이미지가 Python 3.8이라 shutdown(cancel_futures=True) 대신 직접 취소)
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,97 @@
+from io import BytesIO
+
+import pandas as pd
+
+from data.utils.constants import WEATHER_COLUMNS
+
+# 문자열로 읽는 컬럼 (구름 형태, 예: "ScAc")
+KMA_STRING_COLUMNS = ("CloudType",)
+# 결측 없이 항상 값이 있는 정수 컬럼 (관측 시각 YYYYMMDDHHMM, 지점번호)
+KMA_INTEGER_COLUMNS = ("ObservationTime", "StationID")
+# -9가 실제 관측값(영하 9도 등)일 수 있는 컬럼은 -99만 결측으로 봄
+KMA_SIGNED_COLUMNS = (
+    "PressureChange", "Temperature", "DewPointTemperature", "GroundTemperature",
+    "SoilTemperature5cm", "SoilTemperature10cm", "SoilTemperature20cm", "SoilTemperature30cm",
+)
+# 응답에서 결측을 나타내는 값 (숫자는 -9, -9.0, -9.00처럼 표기가 달라도 같은 값으로 비교됨)
+KMA_MISSING_VALUES = (-9, -99, "-")
+KMA_SIGNED_MISSING_VALUES = (-99, "-")
+
+
+def _column_dtypes() -> dict:
+    dtypes = {column: "float64" for column in WEATHER_COLUMNS}
+    dtypes.update({column: "int64" for column in KMA_INTEGER_COLUMNS})
+    dtypes.update({column: "object" for column in KMA_STRING_COLUMNS})
+    return dtypes
+
+
+def _column_missing_values() -> dict:
+    return {
+        column: list(KMA_SIGNED_MISSING_VALUES if column in KMA_SIGNED_COLUMNS else KMA_MISSING_VALUES)
+        for column in WEATHER_COLUMNS if column not in KMA_INTEGER_COLUMNS
+    }
+
+
+KMA_COLUMN_DTYPES = _column_dtypes()
+KMA_COLUMN_MISSING_VALUES = _column_missing_values()
+
+
+def parse_kma_response(body: bytes) -> pd.DataFrame:
+    """
+    기상청 API(kma_sfctm3.php) 응답 본문을 WEATHER_COLUMNS 컬럼의 DataFrame으로 바꿉니다.
+    문자열로 디코딩하거나 줄 단위로 나누지 않고 bytes를 pandas C 파서에 바로 넘기며,
+    # 주석 줄은 파서가 건너뜁니다. 컬럼 타입을 미리 정해두므로 타입 추론도 하지 않습니다.
+
+    - ObservationTime, StationID: int64
+    - CloudType: 문자열 (없으면 null)
+    - 나머지: float64, 결측(-9, -99, "-")은 NaN (기온처럼 -9가 실제 값일 수 있는 컬럼은 -99, "-"만 결측)
+
+    Args:
+        body (bytes): 응답 본문
+
+    Returns:
+        pd.DataFrame: 관측 자료 (응답에 자료가 없으면 빈 DataFrame)
+    """
+    return pd.read_csv(
+        BytesIO(body),
+        sep=r'\s+',  # 공백 구분은 C 파서가 처리 (정규식 파서를 쓰지 않음)
+        comment='#',
+        header=None,
+        names=WEATHER_COLUMNS,
+        dtype=KMA_COLUMN_DTYPES,
+        na_values=KMA_COLUMN_MISSING_VALUES,
+        keep_default_na=False,
+        engine='c',
+    )
+
+
+def coerce_kma_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    예전 파서(문자열 디코딩 + 타입 추론)로 저장된 원천 파티션을 parse_kma_response와 같은 컬럼 타입/결측 표현으로 맞춥니다.
+    예전 파티션은 "-"가 섞인 컬럼이 문자열(object)이고 결측이 -9/-99 값 그대로 남아 있어서,
+    새로 파싱한 행과 그대로 합치면 Parquet으로 저장할 수 없습니다.
+
+    Args:
+        df (pd.DataFrame): 예전 방식으로 저장된 파티션 (ObservationTime은 datetime이어도 됨)
+
+    Returns:
+        pd.DataFrame: 컬럼 타입과 결측값을 정리한 DataFrame (WEATHER_COLUMNS 밖의 컬럼은 그대로)
+    """
+    df = df.copy()
+    for column, missing_values in KMA_COLUMN_MISSING_VALUES.items():
+        if column not in df.columns:
+            continue
+        values = df[column]
+        if column in KMA_STRING_COLUMNS:
+            # 결측 표기는 숫자/문자열 어느 쪽으로 저장됐든 null로
+            missing_texts = {str(value) for value in missing_values} | {f"{value}.0" for value in missing_values if isinstance(value, int)}
+            values = values.astype(object).where(~values.astype(str).isin(missing_texts), None)
+            df[column] = values.where(values.isna(), values.astype(str))
+        else:
+            values = pd.to_numeric(values, errors='coerce').astype("float64")
+            numeric_missing = [value for value in missing_values if not isinstance(value, str)]
+            df[column] = values.mask(values.isin(numeric_missing))
+    for column in KMA_INTEGER_COLUMNS:
+        if column in df.columns and column != "ObservationTime":
+            df[column] = df[column].astype("int64")
+    return df
@@ -0,0 +1,158 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+
+import pandas as pd
+
+from data.utils.constants import PARTITION_WRITE_MAX_WORKERS, PARTITION_WRITE_RETRIES
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionFailure:
+    """ 재시도까지 모두 실패한 파티션 하나 (다시 올릴 수 있도록 데이터도 함께 보관) """
+
+    def __init__(self, path, df, error):
+        self.path = path
+        self.df = df
+        self.error = error
+
+    def __repr__(self):
+        return f"PartitionFailure({self.path!r}, {self.error!r})"
+
+
+class PartitionWriteError(Exception):
+    """ 일부 파티션을 S3에 저장하지 못했을 때 (failures에 실패한 파티션 목록) """
+
+    def __init__(self, failures):
+        self.failures = list(failures)
+        paths = ", ".join(failure.path for failure in self.failures[:5])
+        more = f" 외 {len(self.failures) - 5}개" if len(self.failures) > 5 else ""
+        super().__init__(f"파티션 {len(self.failures)}개 저장 실패: {paths}{more}")
+
+
+def _is_retryable(error: Exception) -> bool:
+    # 권한/경로 문제는 다시 시도해도 똑같이 실패하므로, 그 밖의 입출력 오류(SlowDown, 연결 끊김 등)만 재시도
+    return isinstance(error, OSError) and not isinstance(error, (PermissionError, FileNotFoundError))
+
+
+class PartitionWriter:
+    """
+    일별 파티션들을 하나의 파일 시스템(S3 클라이언트)으로 병렬 업로드합니다.
+    파티션마다 작업자 스레드에서 Parquet으로 직렬화한 뒤 한 번의 PUT(s3.pipe)으로 올리고,
+    일시적인 실패는 재시도하며, 끝내 실패한 파티션은 failures에 모아둡니다. (retry_failed로 다시 올림)
+    동시에 처리 중인 파티션이 max_workers * 2개를 넘으면 submit이 기다리므로 메모리 사용량이 늘어나지 않습니다.
+    """
+
+    def __init__(self, s3, max_workers: int = PARTITION_WRITE_MAX_WORKERS,
+                 retries: int = PARTITION_WRITE_RETRIES, backoff: float = 0.5):
+        self.s3 = s3
+        self.retries = retries
+        self.backoff = backoff
+        self.failures = []
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="partition-write")
+        self._slots = threading.BoundedSemaphore(max(1, max_workers) * 2)
+        self._lock = threading.Lock()
+        self._futures = set()
+        self._started_at = None
+        self._finished_at = None
+        self.written = 0
+        self.written_bytes = 0
+
+    def submit(self, df: pd.DataFrame, path: str) -> Future:
+        """
+        파티션 하나의 업로드를 예약합니다.
+
+        Args:
+            df (pd.DataFrame): 저장할 데이터
+            path (str): 저장 경로 (버킷 포함, 예: partition_path의 결과)
+
+        Returns:
+            Future: 업로드가 성공하면 True, 재시도까지 실패하면 False (failures에 기록됨)
+        """
+        self._slots.acquire()
+        with self._lock:
+            if self._started_at is None:
+                self._started_at = time.perf_counter()
+        try:
+            future = self._executor.submit(self._write, df, path)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future):
+        with self._lock:
+            self._futures.discard(future)
+            self._finished_at = time.perf_counter()
+        self._slots.release()
+
+    def _write(self, df: pd.DataFrame, path: str) -> bool:
+        data = None
+        for attempt in range(self.retries + 1):
+            try:
+                # 직렬화 실패(컬럼 타입 불일치 등)도 업로드 실패와 같이 failures에 기록 (재시도는 하지 않음)
+                if data is None:
+                    buffer = BytesIO()
+                    df.to_parquet(buffer, index=False, engine='pyarrow')
+                    data = buffer.getvalue()
+                self.s3.pipe(path, data)
+                break
+            except Exception as e:
+                if attempt < self.retries and _is_retryable(e):
+                    delay = self.backoff * 2 ** attempt
+                    logger.warning(f"파티션 저장 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.retries}) {path}: {e}")
+                    time.sleep(delay)
+                    continue
+                logger.error(f"S3 저장 중 오류 발생 ({path}): {e}")
+                with self._lock:
+                    self.failures.append(PartitionFailure(path, df, e))
+                return False
+        with self._lock:
+            self.written += 1
+            self.written_bytes += len(data)
+        return True
+
+    def wait(self):
+        """ 예약된 업로드가 모두 끝날 때까지 기다립니다. """
+        while True:
+            with self._lock:
+                futures = list(self._futures)
+            if not futures:
+                return
+            for future in futures:
+                future.exception()
+
+    def retry_failed(self) -> list:
+        """ 실패한 파티션들을 다시 올립니다. (failures는 비워지고, 또 실패하면 다시 기록됨) """
+        with self._lock:
+            failures, self.failures = self.failures, []
+        return [self.submit(failure.df, failure.path) for failure in failures]
+
+    def stats(self) -> dict:
+        """ 저장한 파티션 수, 바이트 수, 실패 수, 처리량(파티션/s, MB/s) """
+        with self._lock:
+            elapsed = (self._finished_at or 0) - (self._started_at or 0)
+            return {
+                "partitions": self.written,
+                "bytes": self.written_bytes,
+                "failures": len(self.failures),
+                "seconds": max(elapsed, 0.0),
+                "partitions_per_second": self.written / elapsed if elapsed > 0 else 0.0,
+                "mb_per_second": self.written_bytes / 1e6 / elapsed if elapsed > 0 else 0.0,
+            }
+
+    def close(self):
+        self.wait()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,3 +1,4 @@
+import json
 import torch
 import pandas as pd
 import s3fs
@@ -22,19 +23,48 @@ def predict(model, device, latest_seq, horizon=168):
         'day': [t.day for t in future_times],
         'hour': [t.hour for t in future_times],
         'day_of_week': [t.strftime('%A') for t in future_times],
-        'pred_Temperature': np.round(preds, 1)})
+        'pred_Temperature': np.round(preds, 1),
+        # 서빙 쪽에서 다시 조립/정렬하지 않도록 시 단위 시각 컬럼을 함께 저장
+        'datetime': [t.replace(minute=0, second=0, microsecond=0) for t in future_times]})
     return df
 
 
 # S3 저장
-def save_predict(pred_df, s3_bucket='mlops-prj', prefix='data/weather/inference/'):
+# station_id를 주면 관측소별 폴더(prefix/station=<id>/)에 저장합니다.
+# 생략하면 기본 관측소(원천 데이터를 수집하는 KMA_STATION_ID)의 예보로 prefix 바로 아래에 저장합니다.
+# (서빙 쪽 common/s3_loader.forecast_prefix와 같은 규칙)
+def save_predict(pred_df, s3_bucket='mlops-prj', prefix='data/weather/inference/', station_id=None):
+    if station_id is not None:
+        prefix = f"{prefix}station={station_id}/"
     now = datetime.now().strftime('%Y%m%d_%H%M')
     file_path = f"{prefix}forecast_{now}.parquet"
     full_path = f"s3://{s3_bucket}/{file_path}"
 
+    # 시각 순으로 정렬해 저장 (서빙 쪽은 정렬 작업을 건너뜀)
+    if 'datetime' in pred_df.columns:
+        pred_df = pred_df.sort_values(by='datetime').reset_index(drop=True)
+
     s3 = s3fs.S3FileSystem()
     pred_df.to_parquet(full_path, index=False, engine='pyarrow', filesystem=s3)
     print(f"예측 결과 저장 완료: {full_path}")
+
+    publish_latest_manifest(s3, s3_bucket, prefix, file_path, pred_df)
     return full_path
 
 
+# 방금 올린 예보 파일을 가리키는 manifest(latest.json)를 덮어씁니다.
+# 서빙 쪽은 폴더 전체를 목록 조회하지 않고 이 작은 파일 하나만 GET 해서 최신 예보를 찾습니다.
+# S3의 PUT은 객체 단위로 원자적이고 Parquet 업로드가 끝난 뒤에 쓰므로,
+# manifest는 항상 완전히 올라간 파일만 가리킵니다.
+def publish_latest_manifest(s3, s3_bucket, prefix, file_path, pred_df):
+    manifest = {
+        "key": file_path,
+        "etag": s3.info(f"{s3_bucket}/{file_path}")["ETag"],
+        "rows": len(pred_df),
+        "horizon": len(pred_df),
+        "created_at": datetime.now().isoformat(timespec='seconds'),
+    }
+    manifest_path = f"{s3_bucket}/{prefix}latest.json"
+    s3.pipe(manifest_path, json.dumps(manifest).encode('utf-8'), ContentType='application/json')
+    print(f"최신 예보 manifest 갱신 완료: s3://{manifest_path}")
+    return manifest
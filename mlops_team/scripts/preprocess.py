@@ -3,6 +3,7 @@ import numpy as np
 import warnings
 import s3fs
 import os
+import sys
 import logging
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
@@ -12,9 +13,32 @@ import sklearn
 from packaging import version
 warnings.filterwarnings('ignore')
 
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+from data.wearher.v1_0_0.kma_parser import coerce_kma_columns
+
 # 환경 변수 로드
 load_dotenv()
 
+# 음수가 될 수 없는 관측 컬럼 (결측 표기 -9 등은 0으로 처리)
+IMPOSSIBLE_NEGATIVE_COLUMNS = [
+    'GustSpeed', 'HourlyRainfall', 'DailyRainfall', 'CumulativeRainfall',
+    'RainfallIntensity', 'SnowDepth3Hr', 'DailySnowDepth', 'TotalSnowDepth',
+    'LowestCloudHeight', 'SunshineDuration', 'SolarRadiation',
+    'WaveHeight', 'MaxWindForce'
+]
+
+# 시간에 따라 연속적으로 변하는 관측 컬럼 (결측은 앞뒤 시각의 값으로 보간)
+CONTINUOUS_COLUMNS = [
+    'WindSpeed', 'LocalPressure', 'SeaLevelPressure', 'PressureChange',
+    'Temperature', 'DewPointTemperature', 'RelativeHumidity', 'VaporPressure',
+    'TotalCloudCover', 'MidLowCloudCover', 'Visibility', 'GroundTemperature',
+    'SoilTemperature5cm', 'SoilTemperature10cm', 'SoilTemperature20cm', 'SoilTemperature30cm'
+]
+
+# 코드형 컬럼(일기 코드, 풍향, 돌풍 시각, 구름 형태 등)의 결측 값 (예전 파티션에 남아 있던 기상청 결측 표기)
+MISSING_CODE = -9
+
 class Feature_Engineering:
     def __init__(self, df=None, is_train=True):
         self.df = df
@@ -50,7 +74,8 @@ class Feature_Engineering:
             except FileNotFoundError:
                 continue
 
-        df_list = [pd.read_parquet(file, filesystem=self.s3) for file in all_files]
+        # 예전 파서로 저장된 파티션(결측이 -9/-99/'-')도 새 파티션과 같은 타입/결측(null)으로 맞춘 뒤 합침
+        df_list = [coerce_kma_columns(pd.read_parquet(file, filesystem=self.s3)) for file in all_files]
         self.df = pd.concat(df_list, ignore_index=True)
         return self.df
 
@@ -59,16 +84,24 @@ class Feature_Engineering:
         for col in self.df.columns:
             if '-' in self.df[col].values:
                 self.df[col] = self.df[col].replace('-', 'Other')
+
+        # 수집 단계(kma_parser)부터는 결측(-9, -99, '-')이 null로 저장됨
+        # 범주형은 예전 '-'와 같이 'Other'로, 음수가 될 수 없는 컬럼은 예전(-9 → 0)처럼 0으로,
+        # 연속 관측값(기온, 기압 등)은 앞뒤 시각의 값으로 보간하고, 나머지 코드형 컬럼은 예전처럼 -9로
+        cat_cols = self.df.select_dtypes(include=['object', 'category', 'string']).columns
+        self.df[cat_cols] = self.df[cat_cols].fillna('Other')
+        zero_cols = [col for col in IMPOSSIBLE_NEGATIVE_COLUMNS if col in self.df.columns]
+        self.df[zero_cols] = self.df[zero_cols].fillna(0)
+        continuous_cols = [col for col in CONTINUOUS_COLUMNS if col in self.df.columns]
+        if self.df[continuous_cols].isna().any().any():
+            self.df[continuous_cols] = self.df[continuous_cols].interpolate(limit_direction='both').fillna(0)
+        num_cols = self.df.select_dtypes(include=['number']).columns
+        self.df[num_cols] = self.df[num_cols].fillna(MISSING_CODE)
         return self.df
 
 
     def impossible_negative(self):
-        impossible_minus_col = [
-            'GustSpeed', 'HourlyRainfall', 'DailyRainfall', 'CumulativeRainfall',
-            'RainfallIntensity', 'SnowDepth3Hr', 'DailySnowDepth', 'TotalSnowDepth',
-            'LowestCloudHeight', 'SunshineDuration', 'SolarRadiation',
-            'WaveHeight', 'MaxWindForce'
-        ]
+        impossible_minus_col = IMPOSSIBLE_NEGATIVE_COLUMNS
         
         for col in impossible_minus_col:
             if col in self.df.columns:
@@ -0,0 +1,134 @@
+# API 입장 제어 (클라이언트별 요청 속도 제한 + 예보 라우트 동시 처리 한도)
+# 한 클라이언트의 폭주나 순간적인 새로고침 몰림이 S3 로딩/pandas 작업을 끝없이 쌓지 않도록,
+# 감당할 수 없는 요청은 오래 붙잡지 않고 바로 429/503(Retry-After 포함)으로 돌려보냅니다.
+import asyncio
+import math
+import os
+import time
+from collections import OrderedDict
+from fastapi import HTTPException, Request
+
+from common.metrics import ADMISSION_IN_FLIGHT, ADMISSION_QUEUED, ADMISSION_REJECTED, ADMISSION_WAITING
+
+# 클라이언트 하나가 보낼 수 있는 초당 요청 수와 순간 허용량 (0이면 속도 제한 끔)
+ADMISSION_RATE_PER_CLIENT = float(os.getenv("ADMISSION_RATE_PER_CLIENT", "20"))
+ADMISSION_BURST = float(os.getenv("ADMISSION_BURST", "40"))
+# 토큰 버킷을 기억해둘 최대 클라이언트 수 (넘으면 가장 오래 요청이 없던 클라이언트부터 잊음)
+ADMISSION_MAX_CLIENTS = int(os.getenv("ADMISSION_MAX_CLIENTS", "10000"))
+# 프록시 뒤에 있을 때만 켜서 X-Forwarded-For의 첫 주소를 클라이언트로 봄
+ADMISSION_TRUST_FORWARDED = os.getenv("ADMISSION_TRUST_FORWARDED", "false").lower() in ("1", "true", "yes")
+
+# 예보 라우트를 동시에 처리할 최대 요청 수와, 자리가 날 때까지 기다릴 수 있는 요청 수/시간(초)
+ADMISSION_MAX_CONCURRENT = int(os.getenv("ADMISSION_MAX_CONCURRENT", "64"))
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "128"))
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "2"))
+# 서버가 포화 상태일 때 다시 시도하라고 알려줄 시간(초)
+ADMISSION_RETRY_AFTER = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+
+
+class ClientRateLimiter:
+    """ 클라이언트별 토큰 버킷. 초당 rate개씩 채워지고 최대 burst개까지 쌓입니다. """
+
+    def __init__(self, rate, burst, max_clients):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets = OrderedDict()  # client -> (남은 토큰, 마지막으로 계산한 시각)
+
+    def acquire(self, client):
+        """ 토큰 하나를 씁니다. 허용되면 0, 아니면 다음 토큰이 생길 때까지 기다려야 하는 시간(초)을 반환합니다. """
+        now = time.monotonic()
+        bucket = self._buckets.pop(client, None)
+        tokens = self.burst if bucket is None else min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+
+        wait_seconds = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait_seconds = (1 - tokens) / self.rate
+
+        # 최근에 요청한 클라이언트가 뒤로 가도록 다시 넣고, 한도를 넘으면 가장 오래된 클라이언트를 버림
+        self._buckets[client] = (tokens, now)
+        if len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return wait_seconds
+
+
+class ConcurrencyLimiter:
+    """ 동시에 처리할 요청 수를 제한합니다. 자리가 없으면 정해진 수/시간만큼만 기다리게 합니다. """
+
+    def __init__(self, max_concurrent, max_queue, queue_timeout):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.waiting = 0
+        # 서버의 이벤트 루프 안에서 처음 쓸 때 만듦 (import 시점의 루프에 묶이지 않도록)
+        self._semaphore = None
+
+    async def acquire(self):
+        """ 자리를 얻으면 True, 대기열이 꽉 찼거나 시간 안에 자리가 나지 않으면 False """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return True
+        if self.waiting >= self.max_queue:
+            return False
+
+        ADMISSION_QUEUED.inc()
+        self.waiting += 1
+        ADMISSION_WAITING.inc()
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.waiting -= 1
+            ADMISSION_WAITING.dec()
+
+    def release(self):
+        self._semaphore.release()
+
+
+_rate_limiter = ClientRateLimiter(ADMISSION_RATE_PER_CLIENT, ADMISSION_BURST, ADMISSION_MAX_CLIENTS)
+_concurrency_limiter = ConcurrencyLimiter(ADMISSION_MAX_CONCURRENT, ADMISSION_MAX_QUEUE, ADMISSION_QUEUE_TIMEOUT)
+
+
+def client_id(request: Request):
+    if ADMISSION_TRUST_FORWARDED:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def rate_limit(request: Request):
+    """ 클라이언트별 요청 속도 제한 (FastAPI 의존성). 한도를 넘으면 429 """
+    if ADMISSION_RATE_PER_CLIENT <= 0:
+        return
+    wait_seconds = _rate_limiter.acquire(client_id(request))
+    if wait_seconds > 0:
+        ADMISSION_REJECTED.labels("rate_limited").inc()
+        raise HTTPException(
+            status_code=429,
+            detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(max(1, math.ceil(wait_seconds)))}
+        )
+
+
+async def limit_concurrency():
+    """ 예보 라우트 동시 처리 한도 (FastAPI 의존성). 자리를 얻지 못하면 503 """
+    if not await _concurrency_limiter.acquire():
+        ADMISSION_REJECTED.labels("overloaded").inc()
+        raise HTTPException(
+            status_code=503,
+            detail="서버가 바쁩니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(ADMISSION_RETRY_AFTER)}
+        )
+    ADMISSION_IN_FLIGHT.inc()
+    try:
+        yield
+    finally:
+        ADMISSION_IN_FLIGHT.dec()
+        _concurrency_limiter.release()
@@ -0,0 +1,204 @@
+# 예보 버전마다 한 번만 직렬화(+압축)해 두고 재사용하는 HTTP 응답 헬퍼
+import gzip
+import os
+import orjson
+from datetime import datetime
+from fastapi import Request, Response
+from common.forecast_index import build_hourly_table
+
+try:
+    import brotli
+except ImportError:  # brotli가 설치되어 있지 않으면 gzip만 제공
+    brotli = None
+
+# 브라우저/CDN/Streamlit 클라이언트가 같은 응답을 다시 묻지 않고 재사용해도 되는 시간(초)
+FORECAST_HTTP_MAX_AGE = int(os.getenv("FORECAST_HTTP_MAX_AGE", "60"))
+
+JSON_MEDIA_TYPE = "application/json"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# 이보다 작은 본문은 압축하지 않고 그대로 보냄
+FORECAST_COMPRESS_MIN_BYTES = int(os.getenv("FORECAST_COMPRESS_MIN_BYTES", "1024"))
+
+# 지원하는 Content-Encoding (q 값이 같으면 앞의 것을 우선)
+# 버전마다 한 번만 압축하므로 압축률이 가장 높은 설정을 사용
+COMPRESSORS = {}
+if brotli is not None:
+    COMPRESSORS["br"] = lambda body: brotli.compress(body, quality=11)
+COMPRESSORS["gzip"] = lambda body: gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def _json_default(obj):
+    # orjson이 직접 처리하지 못하는 pandas Timestamp(datetime의 하위 클래스)는 ISO 형식 문자열로
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"JSON으로 직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+
+def build_forecast_json(snapshot):
+    """ /forecast/latest 응답 본문(orient='records' JSON)을 bytes로 만듭니다. """
+    records = snapshot.df.to_dict(orient="records")
+    return orjson.dumps(records, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def forecast_json(snapshot):
+    return snapshot.derive("forecast_json", build_forecast_json)
+
+
+# 새 예보 버전이 로드될 때 로더 스레드에서 미리 직렬화/압축해두기 위한 함수
+def warm_forecast_json(snapshot):
+    precompress(snapshot, "records", forecast_json(snapshot))
+
+
+def build_forecast_arrow(snapshot):
+    """ 캐시된 Arrow 테이블을 그대로 Arrow IPC stream bytes로 씁니다. (pandas/파이썬 객체 변환 없음) """
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, snapshot.table.schema) as writer:
+        writer.write_table(snapshot.table)
+    return sink.getvalue().to_pybytes()
+
+
+def forecast_arrow(snapshot):
+    return snapshot.derive("forecast_arrow", build_forecast_arrow)
+
+
+def warm_forecast_arrow(snapshot):
+    precompress(snapshot, "arrow", forecast_arrow(snapshot))
+
+
+def build_forecast_ndjson(snapshot):
+    """ 한 줄에 한 시간씩(JSON 객체) 쓴 NDJSON bytes. 전체 행의 딕셔너리 리스트를 만들지 않고 한 행씩 직렬화합니다. """
+    df = snapshot.df
+    names = list(df.columns)
+    rows = zip(*(df[name].tolist() for name in names))
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+    return b"".join(orjson.dumps(dict(zip(names, row)), default=_json_default, option=option) for row in rows)
+
+
+def forecast_ndjson(snapshot):
+    return snapshot.derive("forecast_ndjson", build_forecast_ndjson)
+
+
+def warm_forecast_ndjson(snapshot):
+    precompress(snapshot, "ndjson", forecast_ndjson(snapshot))
+
+
+# /forecast/latest가 Accept 헤더에 따라 돌려주는 형식: media type -> (ETag에 붙는 표현 이름, 본문 함수)
+# 첫 번째 형식(JSON)이 기본값입니다.
+FORECAST_REPRESENTATIONS = {
+    JSON_MEDIA_TYPE: ("records", forecast_json),
+    ARROW_STREAM_MEDIA_TYPE: ("arrow", forecast_arrow),
+    NDJSON_MEDIA_TYPE: ("ndjson", forecast_ndjson),
+}
+
+
+def _parse_qvalues(header):
+    """ 'a;q=0.5, b' 형태의 헤더를 {'a': 0.5, 'b': 1.0}으로 바꿉니다. (헤더에 나온 순서 유지) """
+    qvalues = {}
+    for part in (header or "").split(","):
+        token, *params = [item.strip() for item in part.split(";")]
+        if not token:
+            continue
+        q = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        qvalues[token.lower()] = q
+    return qvalues
+
+
+def negotiate_media_type(accept, offered):
+    """
+    Accept 헤더에서 offered 중 q 값이 가장 높은 형식을 고릅니다.
+    명시적으로 요청한 형식이 없으면(헤더 없음, */* 등) offered의 첫 번째 형식을 반환합니다.
+    """
+    offered = list(offered)
+    best, best_q = offered[0], 0.0
+    for media_type, q in _parse_qvalues(accept).items():
+        if media_type in offered and q > best_q:
+            best, best_q = media_type, q
+    return best
+
+
+def negotiate_encoding(accept_encoding):
+    """ Accept-Encoding에서 COMPRESSORS 중 가장 선호하는 압축 방식을 고릅니다. 없으면 None (압축하지 않음) """
+    qvalues = _parse_qvalues(accept_encoding)
+    default_q = qvalues.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in COMPRESSORS:
+        q = qvalues.get(encoding, default_q)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compressed_body(snapshot, representation, body, encoding):
+    """ 이 버전/형식의 본문을 encoding으로 압축한 bytes (버전마다 한 번만 압축) """
+    return snapshot.derive(f"{representation}.{encoding}", lambda snapshot: COMPRESSORS[encoding](body))
+
+
+# 요청마다 압축하지 않도록, 지원하는 모든 방식으로 미리 압축해 둠
+def precompress(snapshot, representation, body):
+    if len(body) >= FORECAST_COMPRESS_MIN_BYTES:
+        for encoding in COMPRESSORS:
+            compressed_body(snapshot, representation, body, encoding)
+
+
+def hourly_json(snapshot):
+    """ /recommendation/hourly 응답 본문 (시간별 구간 표 + 추천 블록) """
+    return snapshot.derive("hourly_json", lambda snapshot: orjson.dumps(build_hourly_table(snapshot.df)))
+
+
+def warm_hourly_json(snapshot):
+    precompress(snapshot, "hourly", hourly_json(snapshot))
+
+
+def forecast_etag(snapshot, representation):
+    """ S3 예보 객체의 ETag에 표현 형식을 붙여 HTTP ETag를 만듭니다. """
+    return f'"{snapshot.etag}-{representation}"'
+
+
+def forecast_age_headers(snapshot):
+    """ 스냅샷이 마지막으로 최신임을 확인한 뒤 지난 시간(초) """
+    return {"X-Forecast-Age": str(int(snapshot.age))}
+
+
+def _etag_matches(if_none_match, etag):
+    if if_none_match is None:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match 비교는 약한 비교(W/ 접두사 무시)를 사용
+    return "*" in candidates or etag in [tag.removeprefix("W/") for tag in candidates]
+
+
+def cached_forecast_response(request: Request, snapshot, body, representation, media_type, vary=None):
+    """
+    미리 직렬화된 본문으로 응답을 만듭니다.
+    Accept-Encoding에 맞춰 버전마다 한 번 압축해 둔 본문(br/gzip)을 보내고,
+    클라이언트가 If-None-Match로 같은 ETag를 보내면 본문 없이 304를 반환합니다.
+    vary: 본문이 요청 헤더에 따라 달라지는 경우 그 헤더 이름 (캐시가 형식별로 따로 저장하도록)
+    """
+    encoding = None
+    if len(body) >= FORECAST_COMPRESS_MIN_BYTES:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+    # 압축 방식이 다르면 bytes가 다르므로 ETag도 따로 둠
+    etag = forecast_etag(snapshot, representation if encoding is None else f"{representation}-{encoding}")
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={FORECAST_HTTP_MAX_AGE}",
+        "Vary": f"{vary}, Accept-Encoding" if vary else "Accept-Encoding",
+        **forecast_age_headers(snapshot),
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        body = compressed_body(snapshot, representation, body, encoding)
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -1,18 +1,118 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager, suppress
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from datetime import date
-import pandas as pd
+from typing import Annotated, Optional
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 # 공통 모듈들을 import!
-from common.s3_loader import load_latest_forecast_from_s3
-from common.recommender import generate_recommendations
+from common.metrics import FORECAST_CACHE_REQUESTS, HTTP_REQUEST_SECONDS
+from common.personalization import Sensitivity, TempUnit, personalized_daily_payload
+from common.s3_loader import (
+    FORECAST_DEFAULT_STATION_ID, ForecastNotFoundError, cached_station_ids, get_latest_forecast_snapshot_async, peek_forecast_snapshot,
+    register_snapshot_warmer
+)
+from src.admission import limit_concurrency, rate_limit
+from src.forecast_responses import (
+    FORECAST_REPRESENTATIONS, cached_forecast_response, forecast_age_headers, hourly_json, negotiate_media_type,
+    warm_forecast_arrow, warm_forecast_json, warm_forecast_ndjson, warm_hourly_json
+)
+
+logger = logging.getLogger(__name__)
+
+# 백그라운드에서 S3에 새 예보가 올라왔는지 확인하는 주기(초)
+FORECAST_REFRESH_INTERVAL = float(os.getenv("FORECAST_REFRESH_INTERVAL", "60"))
+# 워커가 켜지자마자 백그라운드에서 예보를 미리 불러올지 여부 (끄면 첫 예보 요청이 직접 불러옴)
+FORECAST_PREWARM = os.getenv("FORECAST_PREWARM", "true").lower() in ("1", "true", "yes")
+
+# 예보 데이터 라우트에 거는 입장 제어: 클라이언트별 속도 제한 → 동시 처리 한도
+# (/, /metrics는 헬스체크/지표 수집용이라 제외)
+FORECAST_ROUTE_DEPENDENCIES = [Depends(rate_limit), Depends(limit_concurrency)]
+
+# 예보 데이터 라우트의 관측소 파라미터 (KMA 지점번호, 생략하면 기본 관측소)
+StationId = Annotated[int, Query(ge=1, le=999, description="KMA 관측소 지점번호 (생략하면 기본 관측소)")]
+
+# 새 예보 버전이 로드될 때(로더 스레드에서) 응답 본문을 미리 직렬화/압축해 둠
+# (Arrow/NDJSON도 첫 요청이 이벤트 루프에서 brotli/gzip 압축을 하지 않도록 함께 준비)
+register_snapshot_warmer(warm_forecast_json)
+register_snapshot_warmer(warm_forecast_arrow)
+register_snapshot_warmer(warm_forecast_ndjson)
+register_snapshot_warmer(warm_hourly_json)
+
+
+# 캐시에 올라와 있는 관측소들(처음에는 기본 관측소)의 S3를 주기적으로 확인해 새 예보가 있으면 스냅샷을 통째로 교체합니다.
+# 같은 호스트의 다른 워커가 이번 주기 안에 이미 확인했다면 그 결과(공유 저장소)를 그대로 가져옵니다.
+# S3가 느리거나 실패하면 그 관측소는 마지막으로 성공한 스냅샷을 그대로 계속 사용합니다.
+async def refresh_forecast_periodically():
+    if not FORECAST_PREWARM:
+        await asyncio.sleep(FORECAST_REFRESH_INTERVAL)
+    while True:
+        for station_id in cached_station_ids() or [FORECAST_DEFAULT_STATION_ID]:
+            try:
+                await get_latest_forecast_snapshot_async(max_age=FORECAST_REFRESH_INTERVAL, station_id=station_id)
+            except Exception as e:
+                logger.warning(f"관측소 {station_id} 예보 갱신 실패, 마지막 스냅샷을 계속 사용합니다: {e}")
+        await asyncio.sleep(FORECAST_REFRESH_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    refresher = asyncio.create_task(refresh_forecast_periodically())
+    yield
+    refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresher
+
 
 # FastAPI 앱 생성 및 기본 정보 설정
 app = FastAPI(
     title="날씨 기반 옷차림 추천 API",
     description="최신 날씨 예보 데이터를 기반으로 옷차림과 활동을 추천합니다.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+
+# 라우트별 응답 시간을 기록합니다.
+# 라벨에는 실제 URL 대신 라우트 경로(/recommendation/by_day 등)를 써서 시계열 수가 늘어나지 않게 합니다.
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.labels(
+            request.method, route.path if route is not None else "unmatched", str(status_code)
+        ).observe(time.perf_counter() - started)
+
+
+# 요청 처리 중에는 메모리에 있는 관측소 스냅샷을 사용합니다.
+# 서버가 막 켜졌거나 처음(또는 캐시에서 밀려난 뒤 다시) 요청된 관측소일 때만 직접 불러오며, 이때도 이벤트 루프는 막지 않습니다.
+async def current_forecast_snapshot(station_id=FORECAST_DEFAULT_STATION_ID):
+    snapshot = peek_forecast_snapshot(station_id)
+    FORECAST_CACHE_REQUESTS.labels("hit" if snapshot is not None else "miss").inc()
+    if snapshot is None:
+        try:
+            snapshot = await get_latest_forecast_snapshot_async(station_id=station_id)
+        except Exception as e:
+            if isinstance(e, ForecastNotFoundError) and station_id != FORECAST_DEFAULT_STATION_ID:
+                # 예보를 만들지 않는 관측소
+                raise HTTPException(status_code=404, detail=f"관측소 {station_id}의 예보 데이터가 없습니다.")
+            raise HTTPException(
+                status_code=503,
+                detail=f"예보 데이터를 아직 불러오지 못했습니다. 잠시 후 다시 시도해주세요: {e}",
+                headers={"Retry-After": "5"}
+            )
+    return snapshot
+
+
 # --- API 엔드포인트(기능) 정의 ---
 
 @app.get("/", tags=["기본"])
@@ -21,60 +121,96 @@ async def read_root():
     return {"message": "안녕 안녕~ 날씨 기반 옷차림 추천 API에 오신 것을 환영합니다!!!!!!"}
 
 
-@app.get("/forecast/latest", tags=["날씨 예보"])
-async def get_latest_forecast():
-    """ S3에서 가장 최신 예보(168시간 = 일주일)를 불러와 JSON 형태로 반환합니다. """
+@app.get("/metrics", tags=["기본"])
+async def get_metrics():
+    """ Prometheus가 수집할 서빙 지표 (라우트별 응답 시간, S3 호출/다운로드량, 캐시 적중, 예보 버전/경과 시간 등) """
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/forecast/latest", tags=["날씨 예보"], dependencies=FORECAST_ROUTE_DEPENDENCIES)
+async def get_latest_forecast(request: Request, station_id: StationId = FORECAST_DEFAULT_STATION_ID):
+    """
+    S3에서 관측소(station_id)의 가장 최신 예보(168시간 = 일주일)를 불러와 JSON 형태로 반환합니다.
+    Accept 헤더로 대량 조회용 형식을 고를 수 있습니다.
+    - application/json (기본값): orient='records' 형태([{}, {}, ...])의 JSON
+    - application/vnd.apache.arrow.stream: Arrow IPC stream
+    - application/x-ndjson: 한 줄에 한 시간씩 JSON 객체
+    본문은 예보 버전/형식마다 한 번만 직렬화되며, ETag가 같으면(If-None-Match) 304를 반환합니다.
+    """
+    snapshot = await current_forecast_snapshot(station_id)
+    media_type = negotiate_media_type(request.headers.get("accept"), FORECAST_REPRESENTATIONS)
+    representation, build_body = FORECAST_REPRESENTATIONS[media_type]
     try:
-        df = load_latest_forecast_from_s3()
-        # pandas DataFrame을 JSON으로 변환 (orient='records'는 [{}, {}, ...] 형태)
-        return df.to_dict(orient="records")
+        body = build_body(snapshot)
     except Exception as e:
-        # 데이터 로딩 중 어떤 에러라도 발생하면, 서버 에러(500)로 처리
+        # 데이터 변환 중 어떤 에러라도 발생하면, 서버 에러(500)로 처리
         raise HTTPException(status_code=500, detail=f"서버에서 데이터를 불러오는 중 에러가 발생했습니다: {e}")
+    return cached_forecast_response(request, snapshot, body, representation, media_type, vary="Accept")
 
 
-@app.get("/recommendation/by_day", tags=["옷차림 추천"])
-async def get_daily_recommendation(target_date: date):
+@app.get("/recommendation/by_day", tags=["옷차림 추천"], dependencies=FORECAST_ROUTE_DEPENDENCIES)
+async def get_daily_recommendation(
+    target_date: date,
+    response: Response,
+    sensitivity: Sensitivity = "normal",
+    unit: TempUnit = "C",
+    station_id: StationId = FORECAST_DEFAULT_STATION_ID
+):
     """
     특정 날짜(YYYY-MM-DD 형식)를 입력받아 그날의 옷차림과 활동을 추천합니다.
+    sensitivity(very_cold ~ very_hot)만큼 체감 온도를 보정해 추천하고, 온도는 unit(C/F)으로 반환합니다.
+    station_id를 주면 그 관측소의 예보로 추천합니다.
     """
-    try:
-        df = load_latest_forecast_from_s3()
-        
-        # 입력받은 날짜에 해당하는 데이터만 필터링
-        day_data = df[df['date'] == target_date]
-
-        if day_data.empty:
-            # 해당 날짜의 데이터가 예보에 없을 경우, 클라이언트 에러(404)로 처리
-            raise HTTPException(status_code=404, detail=f"{target_date}의 예보 데이터가 없습니다.")
-
-        # Streamlit 앱에서 했던 것과 똑같이 평균/최저/최고 기온 계산
-        avg_temp = day_data['pred_Temperature'].mean()
-        min_temp = day_data['pred_Temperature'].min()
-        max_temp = day_data['pred_Temperature'].max()
-        temp_diff = max_temp - min_temp
-        
-        # 공통 추천 모듈 호출
-        style_recs, activity_tip, layering_tip = generate_recommendations(avg_temp, temp_diff)
-        
-        # 깔끔한 JSON 형태로 결과를 정리하여 반환
-        return {
-            "target_date": target_date,
-            "weather_summary": {
-                "avg_temp": round(float(avg_temp), 2),      # float()으로 감싸주기
-                "min_temp": round(float(min_temp), 2),      # float()으로 감싸주기
-                "max_temp": round(float(max_temp), 2),      # float()으로 감싸주기
-                "temp_difference": round(float(temp_diff), 2) # float()으로 감싸주기
-            },
-            "recommendations": {
-                "styles": style_recs,
-                "activity_tip": activity_tip,
-                "layering_tip": layering_tip
-            }
-        }
-    except HTTPException as http_exc:
-        # 404 에러는 그대로 다시 발생시킴
-        raise http_exc
-    except Exception as e:
-        # 그 외 모든 에러는 서버 에러(500)로 처리
-        raise HTTPException(status_code=500, detail=f"추천을 생성하는 중 서버 에러가 발생했습니다: {e}")
+    snapshot = await current_forecast_snapshot(station_id)
+    response.headers.update(forecast_age_headers(snapshot))
+
+    # 예보 버전이 로드될 때 미리 만들어둔 날짜별 요약/추천 결과(민감도/단위별로는 LRU에 기억된 결과)를 꺼내 반환
+    payload = personalized_daily_payload(snapshot, target_date, sensitivity, unit)
+    if payload is None:
+        # 해당 날짜의 데이터가 예보에 없을 경우, 클라이언트 에러(404)로 처리
+        raise HTTPException(status_code=404, detail=f"{target_date}의 예보 데이터가 없습니다.")
+    return payload
+
+
+@app.get("/recommendation/range", tags=["옷차림 추천"], dependencies=FORECAST_ROUTE_DEPENDENCIES)
+async def get_range_recommendation(
+    response: Response,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    sensitivity: Sensitivity = "normal",
+    unit: TempUnit = "C",
+    station_id: StationId = FORECAST_DEFAULT_STATION_ID
+):
+    """
+    기간(start ~ end, YYYY-MM-DD)의 날짜별 옷차림/활동 추천을 한 번에 반환합니다.
+    start/end를 생략하면 예보 전체 기간을 반환합니다. (일주일 화면을 요청 한 번으로 그릴 수 있음)
+    sensitivity/unit/station_id는 /recommendation/by_day와 같습니다.
+    """
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail=f"start({start})가 end({end})보다 늦습니다.")
+
+    snapshot = await current_forecast_snapshot(station_id)
+    response.headers.update(forecast_age_headers(snapshot))
+
+    # 날짜별 집계는 예보 버전이 로드될 때 groupby 한 번으로 끝나 있으므로 기간에 맞는 날짜만 골라 반환
+    days = [
+        personalized_daily_payload(snapshot, target_date, sensitivity, unit) for target_date in snapshot.daily_index
+        if (start is None or target_date >= start) and (end is None or target_date <= end)
+    ]
+    if not days:
+        raise HTTPException(status_code=404, detail=f"{start or ''} ~ {end or ''} 기간의 예보 데이터가 없습니다.")
+    return {
+        "start": days[0]["target_date"],
+        "end": days[-1]["target_date"],
+        "days": days
+    }
+
+
+@app.get("/recommendation/hourly", tags=["옷차림 추천"], dependencies=FORECAST_ROUTE_DEPENDENCIES)
+async def get_hourly_recommendation(request: Request, station_id: StationId = FORECAST_DEFAULT_STATION_ID):
+    """
+    관측소(station_id) 예보 전체 기간(168시간)의 시간별 기온과 추천 블록 id를 컬럼 단위로 반환합니다.
+    hours.recommendation_id[i]가 i번째 시간의 추천이며, 내용은 recommendations[id]에 한 번씩만 들어 있습니다.
+    """
+    snapshot = await current_forecast_snapshot(station_id)
+    return cached_forecast_response(request, snapshot, hourly_json(snapshot), "hourly", "application/json")
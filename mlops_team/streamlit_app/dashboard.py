@@ -377,12 +377,7 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
-import numpy as np
-import boto3
-from botocore.exceptions import NoCredentialsError
 import os
 from dotenv import load_dotenv
 import sys # 추가
@@ -391,8 +386,8 @@ import sys # 추가
 project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 # 파이썬이 모듈을 찾는 경로 목록에 이 프로젝트 경로를 추가
 sys.path.append(project_path)
-from common.s3_loader import load_latest_forecast_from_s3  # S3에서 최신 예측 데이터를 로드하는 함수
-from common.recommender import generate_recommendations # 새로 만든 추천 함수 import
+from common.s3_loader import get_latest_forecast_snapshot  # S3에서 최신 예측 데이터(+날짜별 요약 인덱스)를 로드하는 함수
+from common.personalization import personalize_daily_payload # 민감도/단위에 맞춘 추천 (API와 공통)
 
 
 # 페이지 설정
@@ -489,7 +484,9 @@ st.markdown("""
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
 
 # S3에서 최신 예측 데이터를 로드하는 함수
-@st.cache_data(ttl=600) # 10분 주기는 그대로 두되, 수동 버튼을 추가할 것
+# cache_data는 결과를 pickle로 복사해 rerun마다 새 사본을 돌려주므로, 공유 저장소의 메모리 맵을 쓰는 DataFrame과
+# 날짜별 인덱스를 그대로 공유하도록 cache_resource 사용 (반환값은 여러 세션이 함께 쓰므로 수정하면 안 됨)
+@st.cache_resource(ttl=600) # 10분 주기는 그대로 두되, 수동 버튼을 추가할 것
 def load_data_from_s3():
     # .env 파일에서 AWS 정보 불러오기
     aws_access_key_id = os.getenv("AWS_ACCESS_KEY_ID")
@@ -504,13 +501,15 @@ def load_data_from_s3():
         st.stop()
 
     try:
-        df = load_latest_forecast_from_s3()
+        snapshot = get_latest_forecast_snapshot()
+        df = snapshot.df
         # latest_date = df['datetime'].max().strftime('%Y-%m-%d %H:%M')
         # st.success(f"✅ S3에서 최신 데이터를 성공적으로 불러왔습니다. (예측 기준 시점: {latest_date})")
         latest_date = df['datetime'].max().strftime('%Y-%m-%d %H:%M')
         now_str = datetime.now().strftime('%Y-%m-%d %H:%M')
         st.success(f"✅ 데이터 동기화 완료! (가져온 시각: {now_str}  / 최종 예측 시점: {latest_date})")
-        return df
+        # API 서버와 같은 날짜별 요약 인덱스를 함께 반환
+        return df, snapshot.daily_index
     except Exception as e:
         st.error(f"데이터 로딩에 실패했습니다: {e}")
         st.stop()
@@ -527,13 +526,13 @@ def main():
     """, unsafe_allow_html=True)
     
     # 데이터 로드
-    df = get_data_for_app()  # S3에서 데이터 로드
+    df, daily_index = load_data_from_s3()  # S3에서 데이터 로드
 
     # 사이드바 - 날짜 선택 및 설정
     st.sidebar.header("⚙️ 설정")
 
     if st.sidebar.button("🔄 데이터 새로고침"):
-        st.cache_data.clear()  
+        load_data_from_s3.clear()
         st.rerun()  # 데이터 새로고침 버튼 클릭 시 캐시를 지우고 앱을 다시 실행
     
     # 날짜 선택
@@ -566,20 +565,22 @@ def main():
     else:
         day_data['display_temp'] = day_data['pred_Temperature']
     
-    # 민감도에 따른 온도 조정
-    temp_adjustment = {
-        "매우 추위 탐": 3,
-        "추위 탐": 1.5,
-        "보통": 0,
-        "더위 탐": -1.5,
-        "매우 더위 탐": -3
+    # 민감도 슬라이더 값 → 공통 민감도 키 (보정값은 common/personalization.py)
+    sensitivity_keys = {
+        "매우 추위 탐": "very_cold",
+        "추위 탐": "cold",
+        "보통": "normal",
+        "더위 탐": "hot",
+        "매우 더위 탐": "very_hot"
     }
     
-    adjusted_temp = day_data['pred_Temperature'] + temp_adjustment[sensitivity]
-    min_temp = adjusted_temp.min()
-    max_temp = adjusted_temp.max()
-    temp_diff = max_temp - min_temp
-    avg_temp = adjusted_temp.mean()
+    # 날짜별 요약 인덱스에서 미리 계산된 값을 꺼내 민감도만큼 보정 (API의 sensitivity 파라미터와 같은 계산)
+    personalized = personalize_daily_payload(daily_index[selected_date], sensitivity_keys[sensitivity])
+    weather_summary = personalized['weather_summary']
+    min_temp = weather_summary['min_temp']
+    max_temp = weather_summary['max_temp']
+    temp_diff = weather_summary['temp_difference']
+    avg_temp = weather_summary['avg_temp']
     
     # 온도 단위 변환 (표시용)
     if temp_unit == "°F":
@@ -612,6 +613,9 @@ def main():
     with col2:
         st.subheader("📊 시간별 온도 변화")
         
+        # plotly는 import가 무거워서 그래프를 그릴 때 처음 불러옴 (첫 화면의 헤더/사이드바가 먼저 뜨도록)
+        import plotly.graph_objects as go
+
         # Plotly 그래프 생성
         fig = go.Figure()
         
@@ -684,7 +688,9 @@ def main():
     
 
     # style_recommendations, activity_tip = get_recommendations_by_style(avg_temp) 
-    style_recommendations, activity_tip, layering_tip = generate_recommendations(avg_temp, temp_diff)
+    recommendations = personalized['recommendations']
+    style_recommendations = recommendations['styles']
+    activity_tip = recommendations['activity_tip']
 
     # 2. 스타일 종류들을 탭의 이름으로 사용
     style_options = ["캐주얼", "비즈니스", "스포티", "페미닌", "미니멀"]
@@ -1,23 +1,51 @@
+import numpy as np
+from bisect import bisect_right
+
+# 민감도에 따른 체감 온도 보정값
+SENSITIVITY_ADJUSTMENT = {"cold": -2, "normal": 0, "hot": 2}
+
+# 체감 온도 구간표: CLOTH_SENSE_THRESHOLDS[i] 이상이면 CLOTH_SENSE_MESSAGES[i + 1] (추운 구간부터 순서대로)
+CLOTH_SENSE_THRESHOLDS = np.array([10, 15, 20, 25])
+CLOTH_SENSE_MESSAGES = [
+    "두꺼운 외투와 따뜻한 옷차림 필수! 🥶",
+    "스웨터/경량 패딩 추천 🌬️",
+    "긴팔+가디건/자켓 추천 🧥",
+    "얇은 긴팔/반팔+가벼운 겉옷 추천 😄",
+    "반팔과 시원한 옷차림 추천! ☀️",
+]
+
+_CLOTH_SENSE_THRESHOLDS = CLOTH_SENSE_THRESHOLDS.tolist()
+
+
+def cloth_sense_indices(temps, sensitivity: str = "normal") -> np.ndarray:
+    """
+    temps: 예측된 기온 배열
+    sensitivity: 'cold' (추위를 많이 탐), 'normal' (보통), 'hot' (더위를 많이 탐)
+    반환값: 각 기온의 CLOTH_SENSE_MESSAGES 인덱스 배열
+    """
+    adj_temps = np.asarray(temps, dtype=float) + SENSITIVITY_ADJUSTMENT.get(sensitivity, 0)
+    indices = np.searchsorted(CLOTH_SENSE_THRESHOLDS, adj_temps, side='right')
+    # NaN은 어떤 "이상" 조건도 만족하지 않으므로 가장 추운 구간
+    return np.where(np.isnan(adj_temps), 0, indices)
+
+
+def get_cloth_sense_batch(temps, sensitivity: str = "normal") -> list:
+    """ get_cloth_sense의 배열 버전: 예측 기온 전체의 구간을 한 번에 구한 뒤 추천 문구 리스트로 바꿉니다. """
+    temps = np.asarray(temps, dtype=float)
+    indices = cloth_sense_indices(temps, sensitivity)
+    return [
+        f"예상 기온({temp:.1f}°C: {CLOTH_SENSE_MESSAGES[index]}"
+        for temp, index in zip(temps.tolist(), indices.tolist())
+    ]
+
+
 def get_cloth_sense(temp: float, sensitivity: str = "normal") -> str:
     """
     temp: 예측된 기온 (float)
     sensitivity: 'cold' (추위를 많이 탐), 'normal' (보통), 'hot' (더위를 많이 탐)
     """
-    # 민감도에 따라 체감 온도 보정값 설정
-    if sensitivity == "cold":
-        adj_temp = temp - 2  # 추위를 많이 타면 체감 온도를 2도 낮게
-    elif sensitivity == "hot":
-        adj_temp = temp + 2  # 더위를 많이 타면 체감 온도를 2도 높게
-    else:
-        adj_temp = temp
-
-    if adj_temp >= 25:
-        return f"예상 기온({temp:.1f}°C: 반팔과 시원한 옷차림 추천! ☀️"
-    elif 20 <= adj_temp < 25:
-        return f"예상 기온({temp:.1f}°C: 얇은 긴팔/반팔+가벼운 겉옷 추천 😄"
-    elif 15 <= adj_temp < 20:
-        return f"예상 기온({temp:.1f}°C: 긴팔+가디건/자켓 추천 🧥"
-    elif 10 <= adj_temp < 15:
-        return f"예상 기온({temp:.1f}°C: 스웨터/경량 패딩 추천 🌬️"
-    else:
-        return f"예상 기온({temp:.1f}°C: 두꺼운 외투와 따뜻한 옷차림 필수! 🥶"
\ No newline at end of file
+    # 값 하나만 볼 때는 numpy 호출 비용이 더 커서, 같은 구간표를 bisect로 조회
+    adj_temp = temp + SENSITIVITY_ADJUSTMENT.get(sensitivity, 0)
+    index = bisect_right(_CLOTH_SENSE_THRESHOLDS, adj_temp) if adj_temp == adj_temp else 0
+    message = CLOTH_SENSE_MESSAGES[index]
+    return f"예상 기온({temp:.1f}°C: {message}"
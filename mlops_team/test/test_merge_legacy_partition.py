@@ -0,0 +1,55 @@
+# 예전 파서로 저장된 일별 파티션에 새 파서로 받은 행을 합쳐 다시 저장할 수 있는지 확인
+# (로컬 메모리 파일 시스템 사용, S3/기상청 API 없이 실행)
+#   cd mlops_team && python test/test_merge_legacy_partition.py   (또는 pytest test/test_merge_legacy_partition.py)
+import os
+import sys
+from io import StringIO
+
+import fsspec
+import pandas as pd
+
+project_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(project_path)
+os.environ.setdefault("S3_BUCKET_NAME", "test-bucket")
+
+from data.utils.constants import WEATHER_COLUMNS
+from data.wearher.v1_0_0 import ingest_raw_wearher as ingest
+from data.wearher.v1_0_0.fake_kma import make_kma_response
+from data.wearher.v1_0_0.kma_parser import parse_kma_response
+
+
+def parse_legacy(body):
+    """ 예전 fetch_weather_data의 파싱 방식 (문자열 디코딩 + 타입 추론 파서) """
+    raw_data = body.decode("utf-8")
+    data_lines = [line for line in raw_data.strip().split("\n") if not line.startswith("#")]
+    return pd.read_csv(StringIO("\n".join(data_lines)), sep=r'\s+', header=None, names=WEATHER_COLUMNS)
+
+
+def test_merge_legacy_partition():
+    s3 = fsspec.filesystem("memory")
+    s3.store.clear()
+
+    # 00~11시는 예전 방식으로 저장된 파티션 ("-"가 섞인 컬럼은 문자열, 결측은 -9/-99 그대로)
+    legacy = ingest.add_time_columns(parse_legacy(make_kma_response("202401150000", "202401151100")))
+    assert not pd.api.types.is_numeric_dtype(legacy["WeatherCode"])
+    legacy.drop(columns=['year', 'month', 'day']).to_parquet(
+        ingest.partition_path(2024, 1, 15), index=False, engine='pyarrow', filesystem=s3
+    )
+
+    # 10~23시를 새 파서로 받아 합치고 저장 (10, 11시는 겹침)
+    fresh = ingest.add_time_columns(parse_kma_response(make_kma_response("202401151000", "202401152300")))
+    merged = ingest._merge_existing_partition(s3, fresh, 2024, 1, 15)
+    with ingest.PartitionWriter(s3, max_workers=1) as writer:
+        assert writer.submit(merged, ingest.partition_path(2024, 1, 15)).result()
+
+    saved = pd.read_parquet(ingest.partition_path(2024, 1, 15), filesystem=s3)
+    assert len(saved) == 24
+    assert saved["ObservationTime"].is_monotonic_increasing
+    assert saved["WeatherCode"].dtype == "float64"
+    # 예전 행의 결측(-9, "-")도 새 행과 똑같이 NaN
+    assert not saved[["GustSpeed", "WeatherCode"]].isin([-9, -99]).any().any()
+
+
+if __name__ == "__main__":
+    test_merge_legacy_partition()
+    print("OK")